@@ -1,9 +1,26 @@
-from .aer_sampler_adapter import AerSamplerAdapter
-from .aer_simulator_adapter import AerSimulatorAdapter
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .backend_adapter import BackendAdapter
-from .ibm_sampler_adapter import IBMSamplerAdapter
-from .ionq_backend_adapter import IonQBackendAdapter
-from .quafu_backend_adapter import QuafuBackendAdapter
+
+if TYPE_CHECKING:
+    from .aer_sampler_adapter import AerSamplerAdapter
+    from .aer_simulator_adapter import AerSimulatorAdapter
+    from .ibm_sampler_adapter import IBMSamplerAdapter
+    from .ionq_backend_adapter import IonQBackendAdapter
+    from .quafu_backend_adapter import QuafuBackendAdapter
+
+# Each adapter pulls in its own SDK (qiskit-aer, qiskit-ibm-runtime, qiskit-ionq, pyquafu),
+# so adapters are only imported the first time they are accessed.
+_LAZY_ADAPTERS = {
+    "AerSamplerAdapter": ".aer_sampler_adapter",
+    "AerSimulatorAdapter": ".aer_simulator_adapter",
+    "IBMSamplerAdapter": ".ibm_sampler_adapter",
+    "IonQBackendAdapter": ".ionq_backend_adapter",
+    "QuafuBackendAdapter": ".quafu_backend_adapter",
+}
 
 __all__ = [
     "BackendAdapter",
@@ -13,3 +30,15 @@ __all__ = [
     "IBMSamplerAdapter",
     "QuafuBackendAdapter",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ADAPTERS:
+        adapter = getattr(import_module(_LAZY_ADAPTERS[name], __name__), name)
+        globals()[name] = adapter
+        return adapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,16 +2,16 @@ from __future__ import annotations
 
 import math
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import psutil
-from qiskit.primitives.containers import BitArray
 from qiskit_aer.primitives import SamplerV2 as Sampler
 
 from .backend_adapter import BackendAdapter
 
 if TYPE_CHECKING:
     from qiskit import QuantumCircuit
+    from qiskit.primitives.containers import BitArray
 
     from qonscious.results.result_types import ExperimentResult
 
@@ -48,25 +48,34 @@ class AerSamplerAdapter(BackendAdapter):
         return "SamplerV2"
 
     def run(self, circuit: QuantumCircuit, **kwargs) -> ExperimentResult:
+        return self.run_batch([circuit], **kwargs)[0]
+
+    def run_batch(self, circuits: list[QuantumCircuit], **kwargs) -> list[ExperimentResult]:
+        "All circuits are sent to the sampler as the pubs of a single job."
         shots = kwargs.get("shots", 1024)
+        # Aer runs the job in-process right away, so "running" is taken to be "created".
         created = datetime.now(timezone.utc).isoformat()
-        job = self.sampler.run(pubs=[circuit], shots=shots)
-        running = datetime.now(timezone.utc).isoformat()
-        result = job.result()[0]
+        job_result = self.sampler.run(pubs=circuits, shots=shots).result()
         finished = datetime.now(timezone.utc).isoformat()
 
-        raw = result.join_data()
-        arr = raw.astype("uint8", copy=False) if not isinstance(raw, BitArray) else raw.array
-        counts = BitArray(arr, circuit.num_clbits).get_counts()
-
-        return {
-            "counts": counts,
-            "shots": shots,
-            "backend_properties": {"name": "qiskit_aer.primitives.SamplerV2"},
-            "timestamps": {
-                "created": created,
-                "running": running,
-                "finished": finished,
-            },
-            "raw_results": job.result(),
-        }
+        experiment_results: list[ExperimentResult] = []
+        # PrimitiveResult is indexable but not typed as iterable.
+        for index in range(len(job_result)):
+            # join_data() already returns the packed BitArray of all classical registers
+            # (circuits only have classical registers); its get_counts() builds the bitstrings
+            # in bulk, so no re-wrapping is needed.
+            bit_array = cast("BitArray", job_result[index].join_data())
+            experiment_results.append(
+                {
+                    "counts": bit_array.get_counts(),
+                    "shots": shots,
+                    "backend_properties": {"name": "qiskit_aer.primitives.SamplerV2"},
+                    "timestamps": {
+                        "created": created,
+                        "running": created,
+                        "finished": finished,
+                    },
+                    "raw_results": job_result,
+                }
+            )
+        return experiment_results
@@ -14,6 +14,7 @@ from qiskit_aer import AerSimulator
 from qiskit_ibm_runtime import QiskitRuntimeService
 
 from .backend_adapter import BackendAdapter
+from .circuit_cache import CircuitCache
 
 if TYPE_CHECKING:
     from qiskit_aer.backends.backendconfiguration import AerBackendConfiguration
@@ -30,10 +31,17 @@ class AerSimulatorAdapter(BackendAdapter):
     Future version will be better suited to simulate non-IBM backends as well.
     """
 
+    TRANSPILE_CACHE_SIZE = 32
+    OPTIMIZATION_LEVEL = 3
+
     def __init__(self, simulator: AerSimulator, qubits_properties: list, backend_name: str):
         self.simulator = simulator or AerSimulator()
         self.qubits_properties = qubits_properties
         self.backend_name = backend_name
+        # Transpiled circuits, keyed on the structure of the original circuit (see transpile).
+        self._transpile_cache: CircuitCache[QuantumCircuit] = CircuitCache(
+            self.TRANSPILE_CACHE_SIZE
+        )
 
     @classmethod
     def based_on(cls, token, backend_name) -> Self:
@@ -49,7 +57,11 @@ class AerSimulatorAdapter(BackendAdapter):
         )
 
     def transpile(self, circuit: QuantumCircuit) -> QuantumCircuit:
-        return transpile(circuit, self.simulator, optimization_level=3)
+        "Transpiling at level 3 is expensive; reuse the result when the same circuit is run again."
+        return self._transpile_cache.get_or_create(
+            circuit,
+            lambda c: transpile(c, self.simulator, optimization_level=self.OPTIMIZATION_LEVEL),
+        )
 
     @cached_property
     def _backend_properties(self) -> AerBackendProperties | None:
@@ -95,5 +107,5 @@ class AerSimulatorAdapter(BackendAdapter):
                 "running": running,
                 "finished": finished,
             },
-            "raw_results": job.result(),
+            "raw_results": result,
         }
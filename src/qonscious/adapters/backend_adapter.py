@@ -11,6 +11,19 @@ if TYPE_CHECKING:
 class BackendAdapter(Protocol):
     def run(self, circuit: QuantumCircuit, **kwargs) -> ExperimentResult: ...
 
+    def run_batch(self, circuits: list[QuantumCircuit], **kwargs) -> list[ExperimentResult]:
+        """
+        Run several circuits with the same options (e.g., shots).
+
+        Adapters whose backend accepts many circuits in a single job should override this
+        method so that all circuits are submitted at once. By default, circuits are run
+        one after the other.
+
+        Returns:
+            list[ExperimentResult]: One result per circuit, in the same order as `circuits`.
+        """
+        return [self.run(circuit, **kwargs) for circuit in circuits]
+
     @property
     def n_qubits(self) -> int:
         """
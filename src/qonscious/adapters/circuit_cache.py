@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import numpy as np
+from qiskit.circuit import ControlledGate, Gate, Instruction
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from qiskit import QuantumCircuit
+
+V = TypeVar("V")
+
+
+class CircuitCache(Generic[V]):
+    """A thread-safe LRU cache of values computed from circuits (e.g., their transpilations).
+
+    Entries are keyed on the structure of the circuit (see circuit_key), not on the object, so
+    a circuit that is modified after it was cached misses and is processed again. Circuits
+    without a hashable key are never cached.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, circuit: QuantumCircuit, create: Callable[[QuantumCircuit], V]) -> V:
+        "The cached value for the circuit, or create(circuit) (stored for later calls)."
+        key = circuit_key(circuit)
+        if key is None:
+            return create(circuit)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                return value
+        # Creating the value (e.g., transpiling) can be slow, so the lock is not held meanwhile.
+        value = create(circuit)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def circuit_key(circuit: QuantumCircuit) -> tuple | None:
+    """A hashable description of the circuit: its registers, global phase and every instruction
+    with its operands, or None when some parameter cannot be hashed."""
+    try:
+        key = _structure(circuit)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _structure(circuit: QuantumCircuit) -> tuple[Any, ...]:
+    find_bit = circuit.find_bit
+    return (
+        tuple((register.name, register.size) for register in circuit.qregs),
+        tuple((register.name, register.size) for register in circuit.cregs),
+        circuit.num_qubits,
+        circuit.num_clbits,
+        _hashable(circuit.global_phase),
+        tuple(
+            (
+                _operation_key(instruction.operation),
+                tuple(find_bit(qubit).index for qubit in instruction.qubits),
+                tuple(find_bit(clbit).index for clbit in instruction.clbits),
+            )
+            for instruction in circuit.data
+        ),
+    )
+
+
+def _operation_key(operation) -> tuple[Any, ...]:
+    key: tuple[Any, ...] = (
+        operation.name,
+        tuple(_hashable(param) for param in operation.params),
+    )
+    if isinstance(operation, ControlledGate):
+        key += (operation.ctrl_state,)
+    # Gates made with to_gate()/to_instruction() are only identified by their definition;
+    # library gates are fully described by their name and parameters.
+    if type(operation) in (Gate, Instruction) and operation.definition is not None:
+        key += (_structure(operation.definition),)
+    return key
+
+
+def _hashable(param: Any) -> Any:
+    "Arrays (e.g., the matrix of a UnitaryGate) are keyed on their contents."
+    if isinstance(param, np.ndarray):
+        return (param.shape, param.dtype.str, param.tobytes())
+    return param
@@ -12,6 +12,7 @@ except ImportError:
     from typing_extensions import Self
 
 from .backend_adapter import BackendAdapter
+from .circuit_cache import CircuitCache
 
 if TYPE_CHECKING:
     from qiskit import QuantumCircuit
@@ -23,8 +24,15 @@ class IBMSamplerAdapter(BackendAdapter):
     """Adapter to use IBM Quantum SamplerV2 as a remote backend.
     We can also use this to adapt the FakeXX backends"""
 
+    TRANSPILE_CACHE_SIZE = 32
+    OPTIMIZATION_LEVEL = 3
+
     def __init__(self, backend):
         self.backend = backend
+        # Transpiled circuits, keyed on the structure of the original circuit (see _transpile).
+        self._transpile_cache: CircuitCache[QuantumCircuit] = CircuitCache(
+            self.TRANSPILE_CACHE_SIZE
+        )
 
     @classmethod
     def least_busy_backend(cls, token) -> Self:
@@ -48,6 +56,11 @@ class IBMSamplerAdapter(BackendAdapter):
         service = QiskitRuntimeService(channel="ibm_quantum_platform", token=token)
         return [cls(backend) for backend in service.backends(**kwargs)]
 
+    @cached_property
+    def sampler(self) -> Sampler:
+        "Created on first use and reused by every run; the backend of an adapter never changes."
+        return Sampler(mode=self.backend)
+
     @cached_property
     def _backend_configuration(self):
         "QPU configuration obtained as indicated in https://quantum.cloud.ibm.com/docs/en/guides/get-qpu-information"
@@ -81,27 +94,38 @@ class IBMSamplerAdapter(BackendAdapter):
         return self.backend.name
 
     def run(self, circuit: QuantumCircuit, **kwargs) -> ExperimentResult:
+        return self.run_batch([circuit], **kwargs)[0]
+
+    def run_batch(self, circuits: list[QuantumCircuit], **kwargs) -> list[ExperimentResult]:
+        "All circuits are submitted to the sampler in a single job."
         kwargs.setdefault("shots", 1024)
-        sampler = Sampler(mode=self.backend)
-        transpiled_circuit = transpile(circuit, self.backend, optimization_level=3)
-        job = sampler.run([transpiled_circuit], **kwargs)
+        transpiled_circuits = [self._transpile(circuit) for circuit in circuits]
+        job = self.sampler.run(transpiled_circuits, **kwargs)
         result = job.result()
         timestamps = job.metrics().get("timestamps", {})
-        counts = _extract_counts(result)
-        return {
-            "counts": counts,
-            "shots": kwargs["shots"],
-            "backend_properties": {"name": self.backend.name},
-            "timestamps": timestamps,
-            "raw_results": result,
-        }
-
-
-def _extract_counts(result) -> dict:
-    data = result[0].data
-    field_names = [
-        k for k in dir(data) if not k.startswith("_") and hasattr(getattr(data, k), "get_counts")
-    ]
+        return [
+            {
+                "counts": _extract_counts(pub_result),
+                "shots": kwargs["shots"],
+                "backend_properties": {"name": self.backend.name},
+                "timestamps": timestamps,
+                "raw_results": result,
+            }
+            for pub_result in result
+        ]
+
+    def _transpile(self, circuit: QuantumCircuit) -> QuantumCircuit:
+        "Transpiling at level 3 is expensive; reuse the result when the same circuit is run again."
+        return self._transpile_cache.get_or_create(
+            circuit,
+            lambda c: transpile(c, self.backend, optimization_level=self.OPTIMIZATION_LEVEL),
+        )
+
+
+def _extract_counts(pub_result) -> dict:
+    "The DataBin holds one field per classical register, listed by keys()."
+    data = pub_result.data
+    field_names = list(data.keys())
     if len(field_names) != 1:
         raise ValueError(f"Expected exactly one data field with get_counts(), got: {field_names}")
-    return getattr(data, field_names[0]).get_counts()
+    return data[field_names[0]].get_counts()
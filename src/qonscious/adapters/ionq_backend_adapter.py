@@ -91,20 +91,34 @@ class IonQBackendAdapter(BackendAdapter):
         return self.backend.name
 
     def run(self, circuit: QuantumCircuit, **kwargs) -> ExperimentResult:
+        return self.run_batch([circuit], **kwargs)[0]
+
+    def run_batch(self, circuits: list[QuantumCircuit], **kwargs) -> list[ExperimentResult]:
+        "Every job is submitted before waiting on any, so their queue and run times overlap."
         kwargs.setdefault("shots", 1024)
-        created = datetime.now(timezone.utc).isoformat()
-        running = datetime.now(timezone.utc).isoformat()
-        job = self.backend.run([circuit], shots=kwargs["shots"])
-        finished = datetime.now(timezone.utc).isoformat()
-        counts = job.get_counts()
-        return {
-            "counts": counts,
-            "shots": kwargs["shots"],
-            "backend_properties": {"name": self.backend.name},
-            "timestamps": {
-                "created": created,
-                "running": running,
-                "finished": finished,
-            },
-            "raw_results": job.result(),
-        }
+        submissions = []
+        for circuit in circuits:
+            created = datetime.now(timezone.utc).isoformat()
+            job = self.backend.run([circuit], shots=kwargs["shots"])
+            running = datetime.now(timezone.utc).isoformat()
+            submissions.append((job, created, running))
+
+        experiment_results: list[ExperimentResult] = []
+        for job, created, running in submissions:
+            result = job.result()
+            finished = datetime.now(timezone.utc).isoformat()
+            counts = result.get_counts()
+            experiment_results.append(
+                {
+                    "counts": counts,
+                    "shots": kwargs["shots"],
+                    "backend_properties": {"name": self.backend.name},
+                    "timestamps": {
+                        "created": created,
+                        "running": running,
+                        "finished": finished,
+                    },
+                    "raw_results": result,
+                }
+            )
+        return experiment_results
@@ -1,304 +1,446 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import logging
 import math
+import os
+import threading
 import time
-from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from qiskit import QuantumCircuit
     from quafu.backends.backends import Backend as QuafuBackend
 
     from qonscious.results.result_types import ExperimentResult
 
+import quafu.elements.element_gates as qeg
+from qiskit import qasm2
 from quafu import QuantumCircuit as QuafuQuantumCircuit, Task, User
 
 from qonscious.adapters.backend_adapter import BackendAdapter
+from qonscious.adapters.circuit_cache import CircuitCache
 
+logger = logging.getLogger(__name__)
+
+
+class _QuafuSubmission(NamedTuple):
+    "A task sent to Quafu whose results have not been collected yet."
+
+    task: Task
+    task_id: str
+    submit_result: Any
+    shots: int
+    created: str
 
-class QuafuBackendAdapter(BackendAdapter):
-    """Adapter for Quafu with interactive backend selection during CHSH tests."""
 
-    def __init__(self, backend_name: str, api_token: str):
+class QuafuBackendAdapter(BackendAdapter):
+    """Adapter for Quafu backends.
+
+    Both constructor arguments are optional, so the adapter can be created without any
+    interaction (e.g., in scripts or test suites). The backend defaults to the QUAFU_BACKEND
+    environment variable, or ScQ-Sim10 if it is not set. The token defaults to the
+    QUAFU_API_TOKEN environment variable, or else to the account saved by pyquafu.
+    """
+
+    DEFAULT_BACKEND = "ScQ-Sim10"
+
+    POLL_INTERVAL = 0.25
+    POLL_MAX_INTERVAL = 10.0
+    POLL_MIN_INTERVAL = 0.1
+    POLL_BACKOFF = 1.7
+    MAX_WAIT_TIME = 300  # 5 minutes maximum
+    TRANSLATION_CACHE_SIZE = 128
+
+    def __init__(self, backend_name: str | None = None, api_token: str | None = None):
+        backend_name = backend_name or os.getenv("QUAFU_BACKEND", self.DEFAULT_BACKEND)
+        api_token = api_token or os.getenv("QUAFU_API_TOKEN") or None
         self.user = User(api_token)
+        self._token_provided = bool(api_token)
         self.backend = self._get_backend(backend_name)
+        # Quafu translations, keyed on the structure of the Qiskit circuit (see _translate).
+        # run_many translates from worker threads; CircuitCache is thread-safe.
+        self._translation_cache: CircuitCache[QuafuQuantumCircuit] = CircuitCache(
+            self.TRANSLATION_CACHE_SIZE
+        )
+        # Configured template tasks by number of shots (see _task).
+        self._tasks: dict[int, Task] = {}
+        self._tasks_lock = threading.Lock()
 
     def _get_backend(self, backend_name: str) -> QuafuBackend:
         backends = self.user.get_available_backends()
         return backends[backend_name]
 
     def run(self, circuit: QuantumCircuit, **kwargs) -> ExperimentResult:
+        """Runs the circuit and polls Quafu until the task finishes.
+
+        Polling starts every `poll_interval` seconds (0.25 by default) and backs off
+        exponentially up to `poll_max_interval` seconds (10 by default). Both can be
+        passed as keyword arguments; intervals below 0.1 seconds are raised to 0.1.
+        """
         shots = kwargs.get("shots", 1024)
+        try:
+            return self._await_result(self._submit_only(circuit, **kwargs), **kwargs)
+        except Exception as e:
+            logger.exception("Quafu run failed")
+            return self._error_result(shots, e)
 
-        # Convert Qiskit circuit to Quafu circuit
-        quafu_circuit = self._convert_circuit(circuit)
+    def run_batch(self, circuits: list[QuantumCircuit], **kwargs) -> list[ExperimentResult]:
+        """Submits all circuits before waiting for any of them (see run_many), so the whole
+        batch takes about as long as its slowest task.
 
+        run_many runs on a new event loop. When this is called from a running loop (e.g., in a
+        notebook cell, or from run_conditionally in async code), that loop lives in a worker
+        thread, as asyncio does not allow nesting loops."""
         try:
-            task = Task(self.user)
-            task.config(backend=self.backend.name, shots=shots, compile=True)
-
-            # Submit task
-            submit_result = task.send(quafu_circuit, wait=False)
-            task_id = submit_result.taskid
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run_many(circuits, **kwargs))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.run_many(circuits, **kwargs)).result()
+
+    async def run_async(self, circuit: QuantumCircuit, **kwargs) -> ExperimentResult:
+        """Same as run(), but waits for the task without blocking the event loop."""
+        return (await self.run_many([circuit], **kwargs))[0]
+
+    async def run_many(
+        self, circuits: Sequence[QuantumCircuit], **kwargs
+    ) -> list[ExperimentResult]:
+        """Submits all circuits and waits for their tasks concurrently.
+
+        All outstanding tasks are polled together on every tick, sharing a single backoff,
+        so the total wait is close to that of the slowest task instead of the sum of all of
+        them. Results keep the order of `circuits`.
+        """
+        shots = kwargs.get("shots", 1024)
+        submissions = await asyncio.gather(
+            *(asyncio.to_thread(self._submit_only, circuit, **kwargs) for circuit in circuits),
+            return_exceptions=True,
+        )
+
+        results: list[ExperimentResult | None] = [None] * len(circuits)
+        # Index of the circuit -> (submission, latest task status)
+        pending: dict[int, tuple[_QuafuSubmission, Any]] = {}
+        for i, submission in enumerate(submissions):
+            if isinstance(submission, Exception):
+                logger.error("Quafu run failed", exc_info=submission)
+                results[i] = self._error_result(shots, submission)
+            elif isinstance(submission, BaseException):
+                # Cancellation and interrupts are not failed runs; let them propagate.
+                raise submission
+            else:
+                pending[i] = (submission, None)
+
+        poll_interval, poll_max_interval = self._poll_intervals(**kwargs)
+        start_time = time.time()
+        while pending and time.time() - start_time < self.MAX_WAIT_TIME:
+            statuses = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._check_status, submission, last_status)
+                    for submission, last_status in pending.values()
+                )
+            )
+            for i, (task_status, finished) in zip(list(pending), statuses):
+                submission = pending[i][0]
+                if finished:
+                    results[i] = self._experiment_result(submission, task_status)
+                    del pending[i]
+                else:
+                    pending[i] = (submission, task_status)
+            if pending:
+                await asyncio.sleep(poll_interval)
+                poll_interval = min(poll_interval * self.POLL_BACKOFF, poll_max_interval)
 
-            # Wait for completion
-            max_wait_time = 300  # 5 minutes maximum
-            start_time = time.time()
+        for i, (submission, task_status) in pending.items():
+            logger.warning("Timeout waiting for the results of Quafu task %s", submission.task_id)
+            results[i] = self._experiment_result(submission, task_status)
+        return results  # type: ignore[return-value]
 
-            while time.time() - start_time < max_wait_time:
-                try:
-                    # Get task status
-                    task_status = task.retrieve(task_id)
-
-                    # Check status attribute
-                    status = None
-                    if hasattr(task_status, "status"):
-                        status = task_status.status
-                    elif hasattr(task_status, "task_status"):
-                        status = task_status.task_status
-                    elif hasattr(task_status, "state"):
-                        status = task_status.state
-
-                    if status == "Completed":
-                        print(" ✅")
-                        break
-                    elif status in ["Failed", "Cancelled", "Error"]:
-                        print(f"\n❌ Task failed: {status}")
-                        break
-
-                    print(".", end="", flush=True)
-                    time.sleep(5)
-
-                except Exception as e:
-                    print(f"\n⚠️  Error checking status: {e}")
-                    time.sleep(5)
-                    continue
-            else:
-                print("\n⏰ Timeout waiting for results")
-
-            # Get results
-            counts = {}
-            if hasattr(task_status, "results") and hasattr(task_status.results, "counts"):
-                counts = task_status.results.counts
-            elif hasattr(task_status, "counts"):
-                counts = task_status.counts
-            elif hasattr(submit_result, "counts"):
-                counts = submit_result.counts
-
-            # 🔥 CRITICAL FIX: Convert Quafu (little-endian) to expected format (big-endian)
-            converted_counts = {}
-            for bitstring, count in counts.items():
-                # Quafu returns little-endian, CHSH function expects big-endian format
-                converted_bitstring = bitstring[::-1]  # Reverse the bit order
-                converted_counts[converted_bitstring] = count
-
-            print(f"🔀 Endianness conversion: {len(counts)} counts converted")
-            if counts:
-                example_orig = list(counts.keys())[0]
-                example_conv = list(converted_counts.keys())[0]
-                print(f"🔀 Example: '{example_orig}' -> '{example_conv}'")
-
-            return {
-                "counts": converted_counts,  # 🔥 Use converted counts
-                "shots": shots,
-                "backend_properties": {
-                    "name": f"quafu_{self.backend.name}",
-                    "task_id": task_id,
-                },
-                "timestamps": {
-                    "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                    "finished": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                },
-                "raw_results": task_status,
-            }
+    def _submit_only(self, circuit: QuantumCircuit, **kwargs) -> _QuafuSubmission:
+        shots = kwargs.get("shots", 1024)
+        created = datetime.now(timezone.utc).isoformat()
 
+        # Convert Qiskit circuit to Quafu circuit
+        quafu_circuit = self._translate(circuit)
+
+        task = self._task(shots)
+
+        # Submit task
+        submit_result = task.send(quafu_circuit, wait=False)
+        return _QuafuSubmission(task, submit_result.taskid, submit_result, shots, created)
+
+    def _task(self, shots: int) -> Task:
+        """A new Task configured for this backend and number of shots.
+
+        Creating a Task fetches the list of available backends from Quafu, so one configured
+        template per number of shots is kept, and each submission gets a shallow copy of it.
+        Task.send records every task id in submit_history, so each copy gets an empty one of
+        its own; sharing a single Task would grow it forever (and from run_many's threads).
+        """
+        with self._tasks_lock:
+            template = self._tasks.get(shots)
+            if template is None:
+                template = Task(self.user)
+                template.config(backend=self.backend.name, shots=shots, compile=True)
+                self._tasks[shots] = template
+        task = copy.copy(template)
+        task.submit_history = {}
+        return task
+
+    def _await_result(self, submission: _QuafuSubmission, **kwargs) -> ExperimentResult:
+        poll_interval, poll_max_interval = self._poll_intervals(**kwargs)
+        task_status = None
+        start_time = time.time()
+        while time.time() - start_time < self.MAX_WAIT_TIME:
+            task_status, finished = self._check_status(submission, task_status)
+            if finished:
+                break
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * self.POLL_BACKOFF, poll_max_interval)
+        else:
+            logger.warning("Timeout waiting for the results of Quafu task %s", submission.task_id)
+        return self._experiment_result(submission, task_status)
+
+    def _poll_intervals(self, **kwargs) -> tuple[float, float]:
+        "The initial and maximum polling intervals, both clamped to POLL_MIN_INTERVAL."
+        poll_max_interval = max(
+            kwargs.get("poll_max_interval", self.POLL_MAX_INTERVAL), self.POLL_MIN_INTERVAL
+        )
+        poll_interval = min(
+            max(kwargs.get("poll_interval", self.POLL_INTERVAL), self.POLL_MIN_INTERVAL),
+            poll_max_interval,
+        )
+        return poll_interval, poll_max_interval
+
+    def _check_status(self, submission: _QuafuSubmission, last_status: Any) -> tuple[Any, bool]:
+        """Retrieves the task once. Returns the latest task status (the previous one if
+        retrieving fails) and whether the task reached a final state."""
+        task_id = submission.task_id
+        try:
+            # Get task status
+            task_status = submission.task.retrieve(task_id)
         except Exception as e:
-            print(f"\n❌ Error: {e}")
-            import traceback
-
-            traceback.print_exc()
-            return {
-                "counts": {},
-                "shots": shots,
-                "backend_properties": {
-                    "name": f"quafu_{self.backend_name}",
-                    "error": str(e),
-                    "token_used": self._token_provided,
-                },
-                "timestamps": {"created": "", "finished": ""},
-                "raw_results": None,
-            }
-
-    def _simplify_angles(self, params):
+            logger.warning("Error checking status of Quafu task %s: %s", task_id, e)
+            return last_status, False
+
+        # Check status attribute (Quafu's ExecResult calls it task_status)
+        status = (
+            getattr(task_status, "status", None)
+            or getattr(task_status, "task_status", None)
+            or getattr(task_status, "state", None)
+        )
+
+        if status == "Completed":
+            logger.debug("Quafu task %s completed", task_id)
+            return task_status, True
+        if status in ["Failed", "Cancelled", "Error"]:
+            logger.warning("Quafu task %s failed: %s", task_id, status)
+            return task_status, True
+        logger.debug("Quafu task %s status: %s", task_id, status)
+        return task_status, False
+
+    def _experiment_result(
+        self, submission: _QuafuSubmission, task_status: Any
+    ) -> ExperimentResult:
+        # Get results
+        counts = {}
+        if hasattr(task_status, "results") and hasattr(task_status.results, "counts"):
+            counts = task_status.results.counts
+        elif hasattr(task_status, "counts"):
+            counts = task_status.counts
+        elif hasattr(submission.submit_result, "counts"):
+            counts = submission.submit_result.counts
+
+        # 🔥 CRITICAL FIX: Convert Quafu (little-endian) to expected format (big-endian)
+        converted_counts = _reverse_bitstrings(counts)
+
+        logger.debug("Endianness conversion: %d counts converted", len(counts))
+
+        return {
+            "counts": converted_counts,  # 🔥 Use converted counts
+            "shots": submission.shots,
+            "backend_properties": {
+                "name": f"quafu_{self.backend.name}",
+                "task_id": submission.task_id,
+            },
+            "timestamps": {
+                "created": submission.created,
+                "finished": datetime.now(timezone.utc).isoformat(),
+            },
+            "raw_results": task_status,
+        }
+
+    def _error_result(self, shots: int, error: Exception) -> ExperimentResult:
+        return {
+            "counts": {},
+            "shots": shots,
+            "backend_properties": {
+                "name": f"quafu_{self.backend.name}",
+                "error": str(error),
+                "token_used": self._token_provided,
+            },
+            "timestamps": {"created": "", "finished": ""},
+            "raw_results": None,
+        }
+
+    def _translate(self, qiskit_circuit: QuantumCircuit) -> QuafuQuantumCircuit:
+        """Converts the circuit, reusing earlier translations of identical circuits.
+
+        A copy of the cached translation is returned, so submitting it cannot alter the cache.
+        """
+        cached = self._translation_cache.get_or_create(qiskit_circuit, self._convert_circuit)
+        return copy.deepcopy(cached)
+
+    @classmethod
+    def convert_batch(
+        cls, qiskit_circuits: Sequence[QuantumCircuit], workers: int | None = None
+    ) -> list[QuafuQuantumCircuit]:
+        """Converts several Qiskit circuits to Quafu circuits, in parallel.
+
+        For circuits made only of directly supported gates, the Qiskit side of the conversion
+        (see `_conversion_plan`) runs in a pool of `workers` processes (by default, one per
+        CPU). Quafu circuits cannot be pickled, so they are built from the resulting plans in
+        this process. Other circuits are converted as in `_convert_circuit`. Results keep the
+        input order.
+        """
+        direct = [i for i, circuit in enumerate(qiskit_circuits) if _only_supported_gates(circuit)]
+        direct_circuits = [qiskit_circuits[i] for i in direct]
+        if len(direct_circuits) < 2 or workers == 1:
+            plans = [cls._conversion_plan(circuit) for circuit in direct_circuits]
+        else:
+            workers = min(workers or os.cpu_count() or 1, len(direct_circuits))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                plans = list(executor.map(cls._conversion_plan, direct_circuits))
+        converted = {
+            i: cls._build_from_plan(qiskit_circuits[i].num_qubits, plan)
+            for i, plan in zip(direct, plans)
+        }
+        # Circuits with other gates go through OpenQASM, as in _convert_circuit.
+        return [
+            converted[i] if i in converted else cls._convert_circuit(circuit)
+            for i, circuit in enumerate(qiskit_circuits)
+        ]
+
+    @staticmethod
+    def _simplify_angles(params):
         """Convert angles to exact fractions of pi for better precision."""
-        simplified = []
-        for angle in params:
-            # Identificar ángulos comunes con tolerancia
-            if abs(angle - 0.7853981633974483) < 1e-10:  # π/4
-                simplified_angle = math.pi / 4
-                simplified.append(simplified_angle)
-            elif abs(angle - 1.5707963267948966) < 1e-10:  # π/2
-                simplified_angle = math.pi / 2
-                simplified.append(simplified_angle)
-            elif abs(angle + 0.7853981633974483) < 1e-10:  # -π/4
-                simplified_angle = -math.pi / 4
-                simplified.append(simplified_angle)
-            elif abs(angle + 1.5707963267948966) < 1e-10:  # -π/2
-                simplified_angle = -math.pi / 2
-                simplified.append(simplified_angle)
-            elif abs(angle - 3.141592653589793) < 1e-10:  # π
-                simplified_angle = math.pi
-                simplified.append(simplified_angle)
-            elif abs(angle + 3.141592653589793) < 1e-10:  # -π
-                simplified_angle = -math.pi
-                simplified.append(simplified_angle)
-            else:
-                simplified.append(angle)
-        return simplified
+        return [_simplify_angle(float(angle)) for angle in params]
 
-    def _convert_circuit(self, qiskit_circuit: QuantumCircuit) -> QuafuQuantumCircuit:
-        """Convert Qiskit circuit to Quafu circuit usando OpenQASM 2.0"""
+    @classmethod
+    def _convert_circuit(cls, qiskit_circuit: QuantumCircuit) -> QuafuQuantumCircuit:
+        """Convert Qiskit circuit to Quafu circuit usando OpenQASM 2.0
+
+        Circuits made only of gates the manual converter supports are emitted directly,
+        which saves writing and parsing the OpenQASM program."""
+        if _only_supported_gates(qiskit_circuit):
+            return cls._convert_circuit_manual(qiskit_circuit)
 
         try:
             # 🔥 NUEVO: Convertir a OpenQASM 2.0
-            qasm_str = qiskit_circuit.qasm()
-            print(f"🔧 OpenQASM conversion: {len(qasm_str)} characters")
+            qasm_str = qasm2.dumps(qiskit_circuit)
+            logger.debug("OpenQASM conversion: %d characters", len(qasm_str))
 
             # Crear circuito Quafu desde OpenQASM
             quafu_circuit = QuafuQuantumCircuit(qiskit_circuit.num_qubits)
             quafu_circuit.from_openqasm(qasm_str)
 
-            print("✅ Circuito convertido via OpenQASM")
-            print(f"✅ Instrucciones Quafu: {len(quafu_circuit.instructions)}")
-
-            # Mostrar algunas instrucciones para debug
-            print("\n📋 PRIMERAS 10 INSTRUCCIONES QUAFU:")
-            for i, gate in enumerate(quafu_circuit.instructions[:10]):
-                print(f"  {i:2d}. {gate}")
-            if len(quafu_circuit.instructions) > 10:
-                print(f"  ... y {len(quafu_circuit.instructions) - 10} más")
+            logger.debug(
+                "Circuit converted via OpenQASM: %d Quafu instructions",
+                len(quafu_circuit.instructions),
+            )
 
             return quafu_circuit
 
         except Exception as e:
-            print(f"⚠️  OpenQASM conversion failed: {e}")
-            print("🔄 Fallback a conversión manual...")
-            return self._convert_circuit_manual(qiskit_circuit)
+            logger.debug("OpenQASM conversion failed (%s), converting manually", e)
+            return cls._convert_circuit_manual(qiskit_circuit)
 
-    def _convert_circuit_manual(self, qiskit_circuit: QuantumCircuit) -> QuafuQuantumCircuit:
+    @classmethod
+    def _convert_circuit_manual(cls, qiskit_circuit: QuantumCircuit) -> QuafuQuantumCircuit:
         """Fallback: conversión manual de circuito"""
-        quafu_circuit = QuafuQuantumCircuit(qiskit_circuit.num_qubits)
-
-        print(f"🔧 Converting circuit manually: {len(qiskit_circuit)} instructions")
-        print(f"🔧 Qiskit circuit qubits: {qiskit_circuit.num_qubits}")
-
-        # Debug: show all Qiskit circuit instructions
-        print("\n📋 QISKIT INSTRUCTIONS:")
-        for i, instruction in enumerate(qiskit_circuit):
-            gate_name = instruction.operation.name
-            qubits = (
-                [q.index for q in instruction.qubits]
-                if hasattr(instruction.qubits[0], "index")
-                else [q._index for q in instruction.qubits]
-            )
-            params = getattr(instruction.operation, "params", [])
-            print(f"  {i:2d}. {gate_name:8} qubits{qubits} params{params}")
+        return cls._build_from_plan(qiskit_circuit.num_qubits, cls._conversion_plan(qiskit_circuit))
+
+    @classmethod
+    def _conversion_plan(
+        cls, qiskit_circuit: QuantumCircuit
+    ) -> list[tuple[str, list, list | None]]:
+        """The Qiskit side of the manual conversion: (gate name, qubit indices, parameters)
+        for every instruction. It is plain data, so it can be computed in another process.
+        Parameters of rotations are None when they cannot be converted to floats."""
+        # Qiskit 2 bits do not know their position; resolve it once per circuit.
+        qubit_positions = {qubit: i for i, qubit in enumerate(qiskit_circuit.qubits)}
+
+        plan = []
+        for instruction in qiskit_circuit.data:
+            operation = instruction.operation
+            gate_name = operation.name
+            qubit_indices = [qubit_positions[q] for q in instruction.qubits]
+
+            # PARAMETERS WITH IMPROVED PRECISION
+            # Only rotation angles reach Quafu; other parameters are kept as they are.
+            params = operation.params
+            if gate_name in _ROTATION_GATES:
+                try:
+                    params = cls._simplify_angles(params)
+                except TypeError:
+                    params = None
+            else:
+                params = list(params)
+
+            plan.append((gate_name, qubit_indices, params))
+        return plan
+
+    @staticmethod
+    def _build_from_plan(
+        num_qubits: int, plan: list[tuple[str, list, list | None]]
+    ) -> QuafuQuantumCircuit:
+        quafu_circuit = QuafuQuantumCircuit(num_qubits)
+        logger.debug(
+            "Converting circuit manually: %d instructions on %d qubits", len(plan), num_qubits
+        )
 
         converted_count = 0
-        print("\n🎯 PRECISION CONVERSION:")
-        for i, instruction in enumerate(qiskit_circuit):
+        for i, (gate_name, qubit_indices, params) in enumerate(plan):
+            handler = _GATE_HANDLERS.get((gate_name, len(qubit_indices)))
+            if handler is None:
+                logger.warning(
+                    "Gate %d: %s%s on %s - not supported", i, gate_name, params, qubit_indices
+                )
+                continue
             try:
-                gate_name = instruction.operation.name
-
-                # Extract qubit indices
-                qubit_indices = []
-                for q in instruction.qubits:
-                    if hasattr(q, "index"):
-                        qubit_indices.append(q.index)
-                    elif hasattr(q, "_index"):
-                        qubit_indices.append(q._index)
-                    else:
-                        qubit_indices.append(instruction.qubits.index(q))
-
-                # PARAMETERS WITH IMPROVED PRECISION
-                params = []
-                if hasattr(instruction.operation, "params"):
-                    original_params = [float(p) for p in instruction.operation.params]
-                    if original_params and gate_name in ["rx", "ry", "rz"]:
-                        print(f"  Gate {i}: {gate_name} on {qubit_indices}")
-                        params = self._simplify_angles(original_params)
-                    else:
-                        params = original_params
-
-                # GATE CONVERSION
-                converted = False
-                if gate_name == "h" and len(qubit_indices) == 1:
-                    quafu_circuit.h(qubit_indices[0])
-                    converted = True
-                elif gate_name == "x" and len(qubit_indices) == 1:
-                    quafu_circuit.x(qubit_indices[0])
-                    converted = True
-                elif gate_name == "y" and len(qubit_indices) == 1:
-                    quafu_circuit.y(qubit_indices[0])
-                    converted = True
-                elif gate_name == "z" and len(qubit_indices) == 1:
-                    quafu_circuit.z(qubit_indices[0])
-                    converted = True
-                elif gate_name == "rx" and len(qubit_indices) == 1 and params:
-                    quafu_circuit.rx(qubit_indices[0], params[0])
-                    converted = True
-                elif gate_name == "ry" and len(qubit_indices) == 1 and params:
-                    quafu_circuit.ry(qubit_indices[0], params[0])
-                    converted = True
-                elif gate_name == "rz" and len(qubit_indices) == 1 and params:
-                    quafu_circuit.rz(qubit_indices[0], params[0])
-                    converted = True
-                elif gate_name == "cx" and len(qubit_indices) == 2:
-                    quafu_circuit.cnot(qubit_indices[0], qubit_indices[1])
-                    converted = True
-                elif gate_name == "ccx" and len(qubit_indices) == 3:
-                    # Para CCX, usar descomposición básica
-                    print(f"  🔄 CCX {qubit_indices} → descomposición básica")
-                    self._add_ccx_decomposition(
-                        quafu_circuit, qubit_indices[0], qubit_indices[1], qubit_indices[2]
-                    )
-                    converted = True
-                elif gate_name == "measure":
-                    converted = True  # Handled at the end
-                    pass
-
-                if converted:
-                    converted_count += 1
-                else:
-                    print(f"⚠️  Gate {i}: {gate_name}{params} on {qubit_indices} - not supported")
-
+                if params is None:
+                    raise ValueError(f"non-numeric parameters in {gate_name}")
+                handler(quafu_circuit, qubit_indices, params)
+                converted_count += 1
             except Exception as e:
-                print(f"❌ Error in instruction {i}: {e}")
-                continue
+                logger.warning("Error in instruction %d: %s", i, e)
 
-        quafu_circuit.measure(list(range(qiskit_circuit.num_qubits)))
-        print(f"✅ Circuit converted: {converted_count}/{len(qiskit_circuit)} instructions")
-        print(f"✅ Final Quafu instructions: {len(quafu_circuit.instructions)}")
+        # Without arguments Quafu measures every qubit into the classical bit of the same index.
+        quafu_circuit.measure()
+        logger.debug(
+            "Circuit converted: %d/%d instructions, %d Quafu instructions",
+            converted_count,
+            len(plan),
+            len(quafu_circuit.instructions),
+        )
 
         return quafu_circuit
 
-    def _add_ccx_decomposition(self, circuit, control1, control2, target):
+    @staticmethod
+    def _add_ccx_decomposition(circuit, control1, control2, target):
         """Descomposición básica de CCX como fallback"""
-        # Implementación simple usando CNOTs y Hadamards
-        circuit.h(target)
-        circuit.cnot(control2, target)
-        circuit.tdg(target)
-        circuit.cnot(control1, target)
-        circuit.t(target)
-        circuit.cnot(control2, target)
-        circuit.tdg(target)
-        circuit.cnot(control1, target)
-        circuit.t(control2)
-        circuit.t(target)
-        circuit.h(target)
-        circuit.cnot(control1, control2)
-        circuit.t(control1)
-        circuit.tdg(control2)
-        circuit.cnot(control1, control2)
+        qubits = (control1, control2, target)
+        if max(qubits) >= circuit.num:
+            raise ValueError(f"Gate position out of range: {list(qubits)}")
+        # The positions are checked once above, so no gate is added when one is out of range.
+        circuit.add_gates(
+            [gate_class(*(qubits[i] for i in roles)) for gate_class, roles in _CCX_TEMPLATE]
+        )
 
     @property
     def n_qubits(self) -> int:
@@ -315,3 +457,79 @@ class QuafuBackendAdapter(BackendAdapter):
     @property
     def name(self) -> str:
         return self.backend.name
+
+
+# Converters from Qiskit instructions to Quafu gates, keyed by (gate name, number of qubits).
+# Each takes the Quafu circuit, the qubit indices and the (simplified) parameters.
+# Measurements are added all at once after the conversion, so they map to a no-op.
+_GATE_HANDLERS: dict[tuple[str, int], Callable[[QuafuQuantumCircuit, list, list], Any]] = {
+    ("h", 1): lambda qc, q, p: qc.h(q[0]),
+    ("x", 1): lambda qc, q, p: qc.x(q[0]),
+    ("y", 1): lambda qc, q, p: qc.y(q[0]),
+    ("z", 1): lambda qc, q, p: qc.z(q[0]),
+    ("rx", 1): lambda qc, q, p: qc.rx(q[0], p[0]),
+    ("ry", 1): lambda qc, q, p: qc.ry(q[0], p[0]),
+    ("rz", 1): lambda qc, q, p: qc.rz(q[0], p[0]),
+    ("cx", 2): lambda qc, q, p: qc.cnot(q[0], q[1]),
+    ("ccx", 3): lambda qc, q, p: QuafuBackendAdapter._add_ccx_decomposition(qc, *q),
+    ("measure", 1): lambda qc, q, p: None,
+}
+
+# Simple CCX decomposition into CNOT, H, T and T† gates: each gate with the positions it acts
+# on, as indices into (control1, control2, target).
+_CCX_TEMPLATE = (
+    (qeg.HGate, (2,)),
+    (qeg.CXGate, (1, 2)),
+    (qeg.TdgGate, (2,)),
+    (qeg.CXGate, (0, 2)),
+    (qeg.TGate, (2,)),
+    (qeg.CXGate, (1, 2)),
+    (qeg.TdgGate, (2,)),
+    (qeg.CXGate, (0, 2)),
+    (qeg.TGate, (1,)),
+    (qeg.TGate, (2,)),
+    (qeg.HGate, (2,)),
+    (qeg.CXGate, (0, 1)),
+    (qeg.TGate, (0,)),
+    (qeg.TdgGate, (1,)),
+    (qeg.CXGate, (0, 1)),
+)
+
+
+_ROTATION_GATES = frozenset({"rx", "ry", "rz"})
+
+
+def _only_supported_gates(qiskit_circuit: QuantumCircuit) -> bool:
+    "Whether every instruction of the circuit has an entry in _GATE_HANDLERS."
+    return all(
+        (instruction.operation.name, len(instruction.qubits)) in _GATE_HANDLERS
+        for instruction in qiskit_circuit.data
+    )
+
+
+# Multiples k of pi/4 that are snapped to their exact value: ±pi/4, ±pi/2 and ±pi.
+_CANONICAL_QUARTER_TURNS = frozenset({-4, -2, -1, 1, 2, 4})
+
+
+def _simplify_angle(angle: float) -> float:
+    "Snaps the angle to k*pi/4 when it is one of the canonical angles (within 1e-10)."
+    k = round(angle / (math.pi / 4))
+    if k in _CANONICAL_QUARTER_TURNS:
+        canonical = k * math.pi / 4
+        if abs(angle - canonical) < 1e-10:
+            return canonical
+    return angle
+
+
+def _reverse_bitstrings(counts: dict[str, int]) -> dict[str, int]:
+    """Quafu returns little-endian bitstrings, while Qiskit (and the FoMs) expect big-endian.
+
+    Slicing is the fastest way to reverse a short str in CPython; integer bit-reversal
+    tricks need an int() parse and a format() per key and turn out several times slower.
+    """
+    if not counts:
+        return {}
+    if len(next(iter(counts))) == 1:
+        # Single-bit outcomes read the same in both orders.
+        return counts
+    return {bitstring[::-1]: count for bitstring, count in counts.items()}
@@ -31,6 +31,13 @@ class MeritComplianceCheck:
         """
 
         fom_result = self.figure_of_merit.evaluate(backend_adapter, **kwargs)
+        return self.check_result(fom_result)
+
+    def check_result(self, fom_result: FigureOfMeritResult) -> dict:
+        """
+        Apply the decision function to an already evaluated FOM result
+        (e.g., one obtained from a batched run) and return the same dict as check().
+        """
 
         passed = self.decision_function(fom_result)
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
     from qonscious.adapters.backend_adapter import BackendAdapter
-    from qonscious.results.result_types import FigureOfMeritResult
+    from qonscious.results.result_types import ExperimentResult, FigureOfMeritResult
 
 
 class FigureOfMerit(Protocol):
@@ -22,3 +24,28 @@ class FigureOfMerit(Protocol):
             to learn about the attributes that are common to all cases.
         """
         ...
+
+
+@runtime_checkable
+class CircuitFigureOfMerit(FigureOfMerit, Protocol):
+    """
+    I represent a Figure of Merit that is computed from the result of running one circuit.
+    Splitting evaluation into building the experiment and scoring its result lets
+    run_conditionally submit the circuits of several checks to the backend in a single batch.
+    """
+
+    def experiment(self, **kwargs) -> tuple[QuantumCircuit, int]:
+        """
+        Returns:
+            tuple[QuantumCircuit, int]: the circuit to run and the number of shots to run it.
+        """
+        ...
+
+    def evaluate_result(self, run_result: ExperimentResult, **kwargs) -> FigureOfMeritResult:
+        """
+        Params:
+            run_result: the ExperimentResult obtained by running the experiment circuit.
+        Returns:
+            FigureOfMeritResult: the same result evaluate() would have produced.
+        """
+        ...
@@ -6,22 +6,30 @@ A., & Zeng, O. (2025). GRADE: Grover-based Benchmarking Toolkit for Assessing Qu
 
 from __future__ import annotations
 
+import functools
 import math
 import random
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit.library import DiagonalGate, MCXGate, grover_operator
 
-from qonscious.foms.figure_of_merit import FigureOfMerit
+from qonscious.foms.figure_of_merit import CircuitFigureOfMerit
 
 if TYPE_CHECKING:
     from qonscious.adapters.backend_adapter import BackendAdapter
     from qonscious.results.result_types import ExperimentResult, FigureOfMeritResult
 
 MIN_QUBITS = 2  # Grover does not make sense below 2 qubits (N<4) N>M>1
+SHOTS_DEFAULT = 2000
+# Up to this many qubits the oracle is a single diagonal gate (+1 everywhere, -1 on targets).
+# Its synthesis needs about 2**n CNOTs, which never exceeds the per-target MCX oracle up to
+# 6 qubits; above that the MCX form is cheaper when there are few targets.
+DIAGONAL_ORACLE_MAX_QUBITS = 6
 
-class GroverFigureOfMerit(FigureOfMerit):
+class GroverFigureOfMerit(CircuitFigureOfMerit):
 
     def __init__(
         self,
@@ -30,32 +38,52 @@ class GroverFigureOfMerit(FigureOfMerit):
         mu_factor: float,
         num_qubits: int | None = None,
         targets_int: list[int] | None = None,
+        shots: int | None = None,
+        rng: random.Random | None = None,
     ) -> None:
         self.num_targets = int(num_targets)
         self.lambda_factor = float(lambda_factor)
         self.mu_factor = float(mu_factor)
         self.num_qubits = None if num_qubits is None else int(num_qubits)
-        self.targets_int = None if targets_int is None else list(targets_int)
-
-    def evaluate(self, backend_adapter: BackendAdapter) -> FigureOfMeritResult:
-        """"""
-        search_space, target_bitstrings = self._make_search_space_and_targets(
+        if self.num_qubits is not None and self.num_qubits < MIN_QUBITS:
+            raise ValueError(
+                f"GroverFoM: num_qubits={self.num_qubits} doesn't have any sense without "
+                f"entangelment. Grover requieres at least {MIN_QUBITS} Qbits (N>=4)."
+            )
+        self.shots = SHOTS_DEFAULT if shots is None else int(shots)
+        if self.shots <= 0:
+            raise ValueError(f"GroverFoM: shots={self.shots} must be a positive number of shots.")
+        # Random targets are drawn once, here, so every evaluate() searches for the same states
+        # (pass a seeded rng for reproducible targets).
+        self._search_space, self.targets_int = self._make_search_space_and_targets(
             self.num_targets,
             self.num_qubits,
-            self.targets_int
+            None if targets_int is None else list(targets_int),
+            rng,
         )
-        M = len(target_bitstrings)                                # Lenght of targets
-        n = len(target_bitstrings[0]) if M > 0 else 1             # Effective Qbits e.g. "000" = 3
+
+    def evaluate(self, backend_adapter: BackendAdapter, **kwargs) -> FigureOfMeritResult:
+        """"""
+        qc, calc_shots = self.experiment(**kwargs)
+        run_result: ExperimentResult = backend_adapter.run(qc, shots=calc_shots)
+        return self.evaluate_result(run_result, **kwargs)
+
+    def experiment(self, **kwargs) -> tuple[QuantumCircuit, int]:
+        """The shots are the ones this FoM requires (see compute_required_shots); a shots
+        kwarg meant for other figures of merit does not override them."""
+        search_space, targets = self._search_space, self.targets_int
+        M = len(targets)                                          # Lenght of targets
         N = len(search_space)                                     # Search space size
+        n = N.bit_length() - 1                                    # Effective Qbits (N = 2**n)
         R = self._optimal_rounds(N, M)                            # Optimal Grover iterations
 
-        calc_shots = self.compute_required_shots()
-        qc = self._build_grover_circuit(n, target_bitstrings, R)
+        return self._grover_circuit(n, targets, R), self.compute_required_shots()
 
-        run_result: ExperimentResult = backend_adapter.run(qc, shots=calc_shots)
+    def evaluate_result(self, run_result: ExperimentResult, **kwargs) -> FigureOfMeritResult:
+        calc_shots = self.compute_required_shots()
         # Score calculation
         counts = run_result.get("counts", {})
-        properties: dict = self._compute_score(counts, target_bitstrings, calc_shots)
+        properties: dict = self._compute_score(counts, self.targets_bin, calc_shots)
 
         #another plausibles properties to add could be:
         #properties: dict[str, Any] = {
@@ -77,108 +105,127 @@ class GroverFigureOfMerit(FigureOfMerit):
         }
         return evaluation_result
 
-    def compute_required_shots(self) -> int:
-        return 2000# Future implementation could adapt this based on N, M, R, etc.
+    @functools.cached_property
+    def targets_bin(self) -> list[str]:
+        """The targets as n-bit strings, the keys they have in the counts. Targets are fixed
+        at construction, so they are formatted only once."""
+        n = len(self._search_space).bit_length() - 1
+        return [f"{t:0{n}b}" for t in self.targets_int]
 
-    def _optimal_rounds(self, N: int, M: int) -> int: #times the oracle+diffusion is applied
-        R = math.floor((math.pi / 4) * math.sqrt(N/M))
-        return max(0, R)
+    def compute_required_shots(self) -> int:
+        return self.shots# Future implementation could adapt this based on N, M, R, etc.
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _optimal_rounds(N: int, M: int) -> int: #times the oracle+diffusion is applied
+        """Number of rounds maximizing sin²((2R+1)θ) with θ = asin(√(M/N)), i.e. the integer
+        nearest to π/(4θ) - 1/2. Unlike the large-N approximation ⌊π/4·√(N/M)⌋ this stays
+        exact when M/N is not small. It only depends on (N, M), so results are shared by
+        every instance."""
+        if M <= 0:
+            return 0
+        theta = math.asin(math.sqrt(min(M / N, 1.0)))
+        return max(0, math.floor(math.pi / (4 * theta)))
 
     def _make_search_space_and_targets(
         self,
         num_targets: int,
         num_qubits: int | None,
         targets_int: list[int] | None,
-    ) -> tuple[list[int], list[str]]:
+        rng: random.Random | None = None,
+    ) -> tuple[range, list[int]]:
 
         if num_qubits is not None:
-            n = int(num_qubits)
-            if n < MIN_QUBITS:
-                raise ValueError(
-                    f"GroverFoM: num_qubits={n} doesn't have any sense without entangelment"
-                    f"Grover requieres at least {MIN_QUBITS} Qbits (N>=4)."
-                )
+            n = int(num_qubits)  # already checked against MIN_QUBITS in __init__
         else:
             # If not specified, infer n from targets or num_tragets
             if targets_int and len(targets_int) > 0:
                 max_val = max(targets_int)
                 # n para representar el mayor target (0 -> 1 bit), luego clamp a 2
-                inferred = 1 if max_val == 0 else math.ceil(math.log2(max_val + 1))
+                inferred = max(1, int(max_val).bit_length())
             else:
-                inferred = math.ceil(math.log2(max(num_targets, 1)))
+                # ceil(log2(num_targets)), computed exactly on integers
+                inferred = (max(num_targets, 1) - 1).bit_length()
             n = max(MIN_QUBITS, inferred)# fallback to at least MIN_QUBITS if inferred is less
 
-        N = 2**n
-        real_space = list(range(N))
+        N = 1 << n
+        # A range has a length and can be sampled without materializing its 2**n integers
+        search_space = range(N)
 
         # Picking tragets from integers or randomly
         if targets_int is None:
-            if num_targets > len(real_space):
+            if num_targets > N:
                 raise ValueError(
-                    f"Num of Targets: ({num_targets}) > Search Space Lenght ({len(real_space)})"
+                    f"Num of Targets: ({num_targets}) > Search Space Lenght ({N})"
                 )
-            chosen = random.sample(real_space, k=num_targets)
+            chosen = (rng or random).sample(search_space, k=num_targets)
         else:
             chosen = list(targets_int)
             for t in chosen:
                 if not (0 <= t < N):
                     raise ValueError(f"target out of range: {t} ∉ [0,{N-1}]")
 
-        # format tragets to binary strings
-        targets_binary = [format(t, f"0{n}b") for t in chosen]
-        search_space = real_space
-        return search_space, targets_binary
+        return search_space, chosen
 
-    def _build_grover_circuit(self, n: int, targets: list[str], R: int) -> QuantumCircuit:
+    def _grover_circuit(self, n: int, targets: list[int], R: int) -> QuantumCircuit:
+        """The Grover circuit only depends on (n, targets, R), so it is built once and reused
+        by every evaluate() call and every instance with the same configuration (e.g. the
+        same variation in several tests). The order of the targets does not matter, as their
+        phase flips commute. Callers get a copy, so the cached circuit is never mutated."""
+        return _cached_grover_circuit(n, tuple(sorted(targets)), R).copy()
 
-        def build_local_oracle(marked_list: list[str], num_qubits: int) -> QuantumCircuit:
-            qc_oracle = QuantumCircuit(num_qubits, name="Oracle")
-            tgt = num_qubits - 1
-            for bitstr in marked_list:
-                bits_le = list(reversed(bitstr))  # Little-endian
-                zeros = [i for i, b in enumerate(bits_le) if b == "0"]
+    @staticmethod
+    def _build_grover_circuit(n: int, targets: list[int], R: int) -> QuantumCircuit:
+        qc = QuantumCircuit(n, n, name="Grover")
+        qc.h(range(n))
 
-                for i in zeros:
-                    qc_oracle.x(i)
+        step = GroverFigureOfMerit._grover_step(n, targets)
+
+        # The cached step is never mutated, so its instructions can be shared.
+        for _ in range(R):
+            qc.compose(step, qubits=range(n), inplace=True, copy=False)
 
-                if num_qubits > 1:
-                    qc_oracle.h(tgt)
-                    qc_oracle.mcx(list(range(num_qubits - 1)), tgt)
-                    qc_oracle.h(tgt)
-                else:
-                    qc_oracle.z(tgt)
+        qc.measure(range(n), range(n))
+        return qc
 
-                for i in zeros:
-                    qc_oracle.x(i)
+    @staticmethod
+    def _grover_step(n: int, targets: list[int]) -> QuantumCircuit:
+        """One Grover round for (n, targets): the oracle followed by Qiskit's diffusion
+        (grover_operator), built once and reused by later circuits. It is composed rather
+        than appended as an opaque gate because simulators such as Aer's SamplerV2 do not
+        unroll custom gates."""
+        return _cached_grover_step(n, tuple(targets))
+
+    @staticmethod
+    def _build_oracle(marked_list: list[int], num_qubits: int) -> QuantumCircuit:
+        qc_oracle = QuantumCircuit(num_qubits, name="Oracle")
+        if num_qubits <= DIAGONAL_ORACLE_MAX_QUBITS:
+            diagonal = np.ones(1 << num_qubits)
+            diagonal[marked_list] = -1
+            qc_oracle.append(DiagonalGate(diagonal.tolist()), range(num_qubits))
             return qc_oracle
 
-        def build_local_diffusion(num_qubits: int) -> QuantumCircuit:
-            qc_diff = QuantumCircuit(num_qubits, name="Diffusion")
-            qc_diff.h(range(num_qubits))
-            qc_diff.x(range(num_qubits))
+        tgt = num_qubits - 1
+        # One MCX gate object (and one qubit list) shared by every target
+        mcx_gate = MCXGate(num_qubits - 1)
+        mcx_qubits = [*range(num_qubits - 1), tgt]
+        for t in marked_list:
+            # Qubit i holds bit i of the target (little-endian), so flip the qubits whose bit is 0
+            zeros = [i for i in range(num_qubits) if not (t >> i) & 1]
+
+            for i in zeros:
+                qc_oracle.x(i)
 
             if num_qubits > 1:
-                qc_diff.h(num_qubits - 1)
-                qc_diff.mcx(list(range(num_qubits - 1)), num_qubits - 1)
-                qc_diff.h(num_qubits - 1)
+                qc_oracle.h(tgt)
+                qc_oracle.append(mcx_gate, mcx_qubits, copy=False)
+                qc_oracle.h(tgt)
             else:
-                qc_diff.z(0)
-            qc_diff.x(range(num_qubits))
-            qc_diff.h(range(num_qubits))
-            return qc_diff
+                qc_oracle.z(tgt)
 
-        qc = QuantumCircuit(n, n, name="Grover")
-        qc.h(range(n))
-
-        oracle_gate = build_local_oracle(targets, n)
-        diffusion_gate = build_local_diffusion(n)
-
-        for _ in range(R):
-            qc.compose(oracle_gate, qubits=range(n), inplace=True)
-            qc.compose(diffusion_gate, qubits=range(n), inplace=True)
-
-        qc.measure(range(n), range(n))
-        return qc
+            for i in zeros:
+                qc_oracle.x(i)
+        return qc_oracle
 
     def _compute_score(
         self,
@@ -186,19 +233,18 @@ class GroverFigureOfMerit(FigureOfMerit):
         targets: list[str],
         shots: int,
     ) -> dict:
+        # A failed or cancelled run (no counts) scores zero without touching the targets
+        if shots <= 0 or not counts:
+            return {"score": 0.0, "P_T": 0.0, "sigma_T": 0.0, "P_N": 1.0}
 
-        P = {s: c / shots for s, c in counts.items()}
-        # Takes the probabilities of target states
-        P_T = sum(P.get(s, 0.0) for s in targets)
+        # Counts of the target states; only these are ever turned into probabilities.
+        target_counts = np.fromiter(
+            (counts.get(s, 0) for s in targets), dtype=np.int64, count=len(targets)
+        )
+        P_T = float(target_counts.sum()) / shots
         P_N = 1.0 - P_T
-        # Standard deviation of target probabilities
-        M = len(targets)
-        if M:
-            p_list = [P.get(s, 0.0) for s in targets]
-            p_bar = P_T / M
-            sigma_T = (sum((p - p_bar) ** 2 for p in p_list) / M) ** 0.5
-        else:
-            sigma_T = 0.0
+        # Standard deviation of target probabilities (population std, i.e. divided by M)
+        sigma_T = float(target_counts.std()) / shots if len(targets) else 0.0
 
         raw = P_T - (self.lambda_factor * sigma_T) - (self.mu_factor * P_N)
         score = 0.0 if (self.mu_factor * P_N >= P_T) else max(0.0, raw)
@@ -207,3 +253,14 @@ class GroverFigureOfMerit(FigureOfMerit):
                 "sigma_T": sigma_T,
                 "P_N": P_N,
             }
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_grover_circuit(n: int, targets: tuple[int, ...], R: int) -> QuantumCircuit:
+    return GroverFigureOfMerit._build_grover_circuit(n, list(targets), R)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_grover_step(n: int, targets: tuple[int, ...]) -> QuantumCircuit:
+    oracle = GroverFigureOfMerit._build_oracle(list(targets), n)
+    return grover_operator(oracle, name="GroverStep")
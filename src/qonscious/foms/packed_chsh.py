@@ -1,24 +1,39 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit.library import CXGate, HGate, RYGate
 
-from qonscious.foms.figure_of_merit import FigureOfMerit
+from qonscious.foms.figure_of_merit import CircuitFigureOfMerit
 
 if TYPE_CHECKING:
     from qonscious.adapters.backend_adapter import BackendAdapter
     from qonscious.results.result_types import ExperimentResult, FigureOfMeritResult
 
 
-class PackedCHSHTest(FigureOfMerit):
+# The gates of the circuit carry no parameters, so the same instances can be shared.
+_H = HGate()
+_CX = CXGate()
+_MEASUREMENT_ROTATIONS = (
+    (1, RYGate(-np.pi / 4)),
+    (3, RYGate(np.pi / 4)),
+    (4, RYGate(-np.pi / 2)),
+    (5, RYGate(-np.pi / 4)),
+    (6, RYGate(-np.pi / 2)),
+    (7, RYGate(np.pi / 4)),
+)
+
+
+class PackedCHSHTest(CircuitFigureOfMerit):
     """
     I represent a CHSH test, run on 8 qubits (the four Bell pairs), in parallel.
     """
 
+    _CIRCUIT: ClassVar[QuantumCircuit | None] = None
+
     def evaluate(self, backend_adapter: BackendAdapter, **kwargs) -> FigureOfMeritResult:
         """
         Returns:
@@ -28,8 +43,14 @@ class PackedCHSHTest(FigureOfMerit):
                 counts of each observed pait, and "score", computed as E00 + E01 + E10 - E11.
                 experiment_result: an instance of ExperimentResult; the result of the experiment.
         """
-        qc = self._build_circuit()
-        run_result: ExperimentResult = backend_adapter.run(qc, shots=kwargs.get("shots", 1024))
+        qc, shots = self.experiment(**kwargs)
+        run_result: ExperimentResult = backend_adapter.run(qc, shots=shots)
+        return self.evaluate_result(run_result, **kwargs)
+
+    def experiment(self, **kwargs) -> tuple[QuantumCircuit, int]:
+        return self._circuit(), kwargs.get("shots", 1024)
+
+    def evaluate_result(self, run_result: ExperimentResult, **kwargs) -> FigureOfMeritResult:
         CHSH_Scores: dict = compute_parallel_CHSH_scores(run_result["counts"])
         evaluation_result: FigureOfMeritResult = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -39,48 +60,59 @@ class PackedCHSHTest(FigureOfMerit):
         }
         return evaluation_result
 
-    def _build_circuit(self) -> QuantumCircuit:
+    @classmethod
+    def _circuit(cls) -> QuantumCircuit:
+        """The circuit has no parameters, so it is built once for all instances. Callers get a
+        copy, so the shared circuit is never mutated."""
+        if cls._CIRCUIT is None:
+            cls._CIRCUIT = cls._build_circuit()
+        return cls._CIRCUIT.copy()
+
+    @staticmethod
+    def _build_circuit() -> QuantumCircuit:
         qc = QuantumCircuit(8, 8)
 
         for i in range(0, 8, 2):
-            qc.h(i)
-            qc.cx(i, i + 1)
+            qc.append(_H, [i], copy=False)
+            qc.append(_CX, [i, i + 1], copy=False)
 
         # Measurement settings
-        qc.ry(-np.pi / 4, 1)
-        qc.ry(np.pi / 4, 3)
-        qc.ry(-np.pi / 2, 4)
-        qc.ry(-np.pi / 4, 5)
-        qc.ry(-np.pi / 2, 6)
-        qc.ry(np.pi / 4, 7)
+        for qubit, gate in _MEASUREMENT_ROTATIONS:
+            qc.append(gate, [qubit], copy=False)
 
         qc.measure(range(8), range(8))
         return qc
 
 
+_PAIR_SHIFTS = np.array([0, 2, 4, 6], dtype=np.uint8)
+_PAIR_SIGNS = np.array([1.0, -1.0, -1.0, 1.0])
+# Row k holds the +/-1 sign of each Bell pair for the 8-bit outcome k. There are only 256
+# possible outcomes, so the whole sign computation is precomputed once.
+_SIGNS_BY_OUTCOME = _PAIR_SIGNS[(np.arange(256, dtype=np.uint8)[:, None] >> _PAIR_SHIFTS) & 3]
+
+
 def compute_parallel_CHSH_scores(counts: dict) -> dict:
-    pair_counts = [defaultdict(int) for _ in range(4)]
-
-    for bitstring, count in counts.items():
-        bits = bitstring[::-1]
-        for i in range(4):
-            a = bits[2 * i]
-            b = bits[2 * i + 1]
-            pair_counts[i][a + b] += count
-
-    def compute_E(c):
-        total = sum(c.values())
-        if total == 0:
-            return 0
-        return sum((1 if k in ("00", "11") else -1) * n / total for k, n in c.items())
-
-    E = [compute_E(c) for c in pair_counts]
+    """counts maps bitstrings to shot counts; probabilities or quasi-probabilities work as well.
+    Outcomes may also be given as integers (e.g. BitArray.get_int_counts()), which skips parsing."""
+    if counts and isinstance(next(iter(counts)), int):
+        keys = np.fromiter(counts.keys(), dtype=np.uint8, count=len(counts))
+    else:
+        # Parse all 8-character keys at once: ASCII '0'/'1' -> bits -> one uint8 per key
+        chars = np.frombuffer("".join(counts).encode("ascii"), dtype=np.uint8)
+        keys = np.packbits(chars.reshape(len(counts), 8) - ord("0"), axis=1).ravel()
+    cnt = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+    total = cnt.sum()
+
+    # Dense histogram over all 256 outcomes, contracted with their pair signs (+1 where
+    # the two qubits of a pair agree, -1 where they differ).
+    histogram = np.bincount(keys, weights=cnt, minlength=256)
+    E = histogram @ _SIGNS_BY_OUTCOME / total if total > 0 else np.zeros(4)
     S = E[0] + E[1] + E[2] - E[3]
 
     return {
-        "E00": E[0],
-        "E01": E[1],
-        "E10": E[2],
-        "E11": E[3],
-        "score": S,
+        "E00": float(E[0]),
+        "E01": float(E[1]),
+        "E10": float(E[2]),
+        "E11": float(E[3]),
+        "score": float(S),
     }
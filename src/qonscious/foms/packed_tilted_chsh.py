@@ -1,9 +1,32 @@
 # qonscious/foms/packed_tilted_chsh.py
-import numpy as np
 from datetime import datetime, timezone
+from functools import cached_property
+from typing import ClassVar
+
+import numpy as np
 from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
 from qonscious.foms.figure_of_merit import FigureOfMerit
 
+# (alice_setting, bob_setting) de los cuatro correladores, en el orden A0B0, A0B1, A1B0, A1B1;
+# el par p del circuito empaquetado mide _SETTINGS[p]
+_SETTINGS = ((0, 0), (0, 1), (1, 0), (1, 1))
+# Ángulo de la rotación RY de Bob para B0 (-45°) y B1 (+45°)
+_BOB_ANGLES = (float(-np.pi / 4), float(np.pi / 4))
+_TWO_SQRT2 = float(2.0 * np.sqrt(2.0))  # Cota de Tsirelson del CHSH estándar
+# Fila k: signo ±1 de cada correlador A·B (los dos bits del par coinciden) y de cada medición
+# de Alice (bit 2p en 0) para el outcome de 8 bits k; el par p usa los bits (2p, 2p+1)
+_OUTCOMES = np.arange(256)[:, None]
+_ALICE_BITS = (_OUTCOMES >> np.array([0, 2, 4, 6])) & 1
+_BOB_BITS = (_OUTCOMES >> np.array([1, 3, 5, 7])) & 1
+_SIGNS_BY_OUTCOME = np.hstack(
+    [1 - 2 * (_ALICE_BITS ^ _BOB_BITS), 1 - 2 * _ALICE_BITS]
+).astype(float)
+# Ángulo del estado tilted; el circuito se arma una vez con este parámetro y cada instancia
+# sólo le asigna su beta
+_BETA = Parameter("β")
+
 
 class PackedTiltedCHSHTest(FigureOfMerit):
     """
@@ -12,97 +35,92 @@ class PackedTiltedCHSHTest(FigureOfMerit):
     https://www.nature.com/articles/s41534-025-01029-6
     """
 
-
+    _TEMPLATE: ClassVar[QuantumCircuit | None] = None
 
     def __init__(self, eta: float = 1.0):
-    """
-    eta: eficiencia de detección o fidelidad promedio de readout (ej: 0.90 para 90%)
-    Se asume simétrica en ambos lados.
-    """
-    
-    
+        """
+        eta: eficiencia de detección o fidelidad promedio de readout (ej: 0.90 para 90%)
+        Se asume simétrica en ambos lados.
+        """
         if not 0.66 < eta <= 1.0:
             raise ValueError("eta debe estar entre ~0.67 y 1.0 para tener ventaja cuántica")
         self.eta = float(eta)
         self.alpha = 0.0 if eta >= 1.0 else (1.0 / eta - 1.0)
-        
-        # Parámetros óptimos para tilted CHSH
-        self.beta = np.pi/4 if self.alpha == 0 else np.arctan(np.sqrt(self.alpha))
-        
+
+    @cached_property
+    def beta(self) -> float:
+        "Parámetro óptimo del estado para tilted CHSH; se calcula una sola vez por instancia."
+        return np.pi/4 if self.alpha == 0 else float(np.arctan(np.sqrt(self.alpha)))
+
     def _max_quantum_value(self) -> float:
-        return 2.0 * np.sqrt(2.0 * (1.0 + self.alpha))
+        return _TWO_SQRT2 * float(np.sqrt(1.0 + self.alpha))
 
-    def _build_bell_state(self) -> QuantumCircuit:
-        qc = QuantumCircuit(2, 2)
-        qc.ry(2 * self.beta, 0)
-        qc.cx(0, 1)
-        return qc
+    @staticmethod
+    def _build_circuit() -> QuantumCircuit:
+        """Un único circuito de 8 qubits con los cuatro pares de Bell (empaquetados, como en
+        PackedCHSHTest): el par p usa los qubits (2p, 2p+1) y la configuración _SETTINGS[p].
+        El estado depende del parámetro _BETA."""
+        qc = QuantumCircuit(8, 8)
+        for pair, (alice_setting, bob_setting) in enumerate(_SETTINGS):
+            alice, bob = 2 * pair, 2 * pair + 1
+            qc.ry(2 * _BETA, alice)
+            qc.cx(alice, bob)
+
+            # Alice: A0=Z, A1=X
+            if alice_setting == 1:
+                qc.h(alice)
+
+            # Bob: B0 a -45°, B1 a +45°
+            qc.ry(_BOB_ANGLES[bob_setting], bob)
 
-    def _build_measurement_circuit(self, alice_setting: int, bob_setting: int) -> QuantumCircuit:
-        qc = self._build_bell_state()
-        
-        # Alice: A0=Z, A1=X
-        if alice_setting == 1:
-            qc.h(0)
-        
-        # Bob: B0 a -45°, B1 a +45°
-        if bob_setting == 0:
-            qc.ry(-np.pi/4, 1)
-        else:
-            qc.ry(+np.pi/4, 1)
-        
-        qc.measure([0, 1], [0, 1])
+        qc.measure(range(8), range(8))
         return qc
 
-    def _compute_expectation(self, counts: dict) -> float:
-        total = sum(counts.values())
-        if total == 0:
-            return 0.0
-        
-        corr = 0
-        for outcome, count in counts.items():
-            if len(outcome) >= 2:
-                a, b = int(outcome[0]), int(outcome[1])
-                corr += (1 if a == b else -1) * count
-        
-        return corr / total
-
-    def _compute_single_expectation(self, counts: dict) -> float:
-        total = sum(counts.values())
+    @classmethod
+    def _template(cls) -> QuantumCircuit:
+        "El circuito parametrizado se construye una vez y lo comparten todas las instancias."
+        if cls._TEMPLATE is None:
+            cls._TEMPLATE = cls._build_circuit()
+        return cls._TEMPLATE
+
+    @cached_property
+    def _circuit(self) -> QuantumCircuit:
+        "Sólo depende de beta, que es fija para cada instancia: se asigna una sola vez."
+        return self._template().assign_parameters({_BETA: self.beta})
+
+    @staticmethod
+    def _compute_expectations(counts: dict) -> np.ndarray:
+        """Valores esperados de los cuatro correladores (uno por par) y de la medición de Alice
+        en cada par, en ese orden. Con un histograma de los 256 outcomes posibles y la tabla de
+        signos _SIGNS_BY_OUTCOME, todos salen de un único bincount y un producto matricial."""
+        # Los 8 caracteres '0'/'1' de cada outcome se convierten juntos a un uint8 por outcome
+        chars = np.frombuffer("".join(counts).encode("ascii"), dtype=np.uint8)
+        keys = np.packbits(chars.reshape(len(counts), 8) - ord("0"), axis=1).ravel()
+        vals = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        total = vals.sum()
         if total == 0:
-            return 0.0
-        
-        exp = 0
-        for outcome, count in counts.items():
-            if len(outcome) >= 1:
-                bit = int(outcome[0])
-                exp += (1 if bit == 0 else -1) * count
-        
-        return exp / total
+            return np.zeros(_SIGNS_BY_OUTCOME.shape[1])
+        histogram = np.bincount(keys, weights=vals, minlength=256)
+        return histogram @ _SIGNS_BY_OUTCOME / total
 
     def evaluate(self, backend_adapter, **kwargs):
         shots = kwargs.get("shots", 100000)
-        
-        expectations = {}
-        for a in [0, 1]:
-            for b in [0, 1]:
-                circuit = self._build_measurement_circuit(a, b)
-                result = backend_adapter.run(circuit, shots=shots)
-                expectations[f"A{a}B{b}"] = self._compute_expectation(result["counts"])
-
-        # Medir ⟨A1⟩
-        circuit_A1 = QuantumCircuit(2, 1)
-        circuit_A1.ry(2 * self.beta, 0)
-        circuit_A1.cx(0, 1)
-        circuit_A1.h(0)
-        circuit_A1.measure(0, 0)
-        result_A1 = backend_adapter.run(circuit_A1, shots=shots)
-        A1_exp = self._compute_single_expectation(result_A1["counts"])
+
+        run_result = backend_adapter.run(self._circuit, shots=shots)
+        values = self._compute_expectations(run_result["counts"])
+        correlators, alice = values[:4], values[4:]
+
+        expectations = {
+            f"A{a}B{b}": float(correlators[pair]) for pair, (a, b) in enumerate(_SETTINGS)
+        }
+        # ⟨A1⟩ no depende de lo que mida Bob, así que se toma de los dos pares que miden A1
+        A1_exp = float(np.mean([alice[pair] for pair, (a, _) in enumerate(_SETTINGS) if a == 1]))
 
         # Calcular score
         A0B0, A0B1, A1B0, A1B1 = (expectations[k] for k in ["A0B0", "A0B1", "A1B0", "A1B1"])
         chsh_raw = A0B0 + A0B1 + A1B0 - A1B1
         tilted_score = chsh_raw + self.alpha * A1_exp
+        max_quantum_value = self._max_quantum_value()
 
         return {
             "figure_of_merit": "PackedTiltedCHSHTest",
@@ -113,8 +131,9 @@ class PackedTiltedCHSHTest(FigureOfMerit):
                 "eta": self.eta,
                 "A1_expectation": A1_exp,
                 "expectations": expectations,
-                "max_quantum_bound": self._max_quantum_value(),
-                "quantum_efficiency": tilted_score / self._max_quantum_value(),
+                "max_quantum_bound": max_quantum_value,
+                "quantum_efficiency": tilted_score / max_quantum_value,
             },
+            "experiment_result": run_result,
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
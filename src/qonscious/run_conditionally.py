@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, Any
 
+from qonscious.checks.merit_compliance_check import MeritComplianceCheck
+from qonscious.foms.figure_of_merit import CircuitFigureOfMerit
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+
+    from qiskit import QuantumCircuit
 
     from qonscious.actions.qonscious_action import QonsciousAction
     from qonscious.adapters.backend_adapter import BackendAdapter
-    from qonscious.checks.merit_compliance_check import MeritComplianceCheck
-    from qonscious.results.result_types import FigureOfMeritResult, QonsciousResult
+    from qonscious.results.result_types import (
+        ExperimentResult,
+        FigureOfMeritResult,
+        QonsciousResult,
+    )
 
 
 def run_conditionally(
@@ -16,6 +26,9 @@ def run_conditionally(
     checks: Sequence[MeritComplianceCheck],
     on_pass: QonsciousAction,
     on_fail: QonsciousAction,
+    *,
+    parallel: bool = True,
+    early_exit: bool = True,
     **kwargs: Any,
 ) -> QonsciousResult:
     """
@@ -25,6 +38,11 @@ def run_conditionally(
     and executes the appropriate action depending on whether all
     checks pass or any check fails.
 
+    When several checks rely on circuit-based figures of merit, their circuits
+    are submitted together through `backend_adapter.run_batch()`. The remaining
+    checks are independent of each other and, unless `parallel` is False, run
+    concurrently in a thread pool (they mostly wait on simulators or remote backends).
+
     Args:
         backend_adapter: Adapter to the quantum backend on which figures of merit
             are evaluated and circuits may be executed.
@@ -33,6 +51,13 @@ def run_conditionally(
             `run(backend_adapter, fom_results, **kwargs)` and return an `ExperimentResult`
              or `None`.
         on_fail: Action to execute if any check fails. Same contract as `on_pass`.
+        parallel: Whether to run independent checks concurrently. Results keep the
+            order of `checks` either way.
+        early_exit: Stop evaluating checks as soon as one fails, so no more backend time is
+            spent once the outcome is known. Only the results of the checks that were
+            evaluated are reported. Checks already running in parallel cannot be
+            interrupted; their results are discarded. Set it to False to always
+            evaluate every check.
         **kwargs: Additional keyword arguments forwarded to the checks and actions.
 
     Returns:
@@ -40,14 +65,29 @@ def run_conditionally(
             and, if applicable, the experiment result produced by the action.
     """
 
-    fom_results: list[FigureOfMeritResult] = []
-    passed = True
+    check_results: dict[int, dict] = {}
+    batchable = [index for index, check in enumerate(checks) if _is_batchable(check)]
+    if len(batchable) > 1:
+        batched_checks = [checks[index] for index in batchable]
+        check_results.update(
+            zip(batchable, _check_in_batch(backend_adapter, batched_checks, **kwargs))
+        )
+
+    pending = [index for index in range(len(checks)) if index not in check_results]
+    if early_exit and not _all_passed(check_results.values()):
+        pending = []
+    if parallel and len(pending) > 1:
+        _check_concurrently(backend_adapter, checks, pending, check_results, early_exit, **kwargs)
+    else:
+        for index in pending:
+            check_results[index] = checks[index].check(backend_adapter, **kwargs)
+            if early_exit and not check_results[index]["passed"]:
+                break
 
-    for check in checks:
-        result = check.check(backend_adapter, **kwargs)
-        fom_results.append(result["fom_result"])
-        if not result["passed"]:
-            passed = False
+    fom_results: list[FigureOfMeritResult] = [
+        check_results[index]["fom_result"] for index in sorted(check_results)
+    ]
+    passed = _all_passed(check_results.values())
 
     if passed:
         run_result = on_pass.run(backend_adapter, fom_results, **kwargs)
@@ -59,3 +99,62 @@ def run_conditionally(
         "figures_of_merit_results": fom_results,
         "experiment_result": run_result,
     }
+
+
+def _all_passed(results: Iterable[dict]) -> bool:
+    return all(result["passed"] for result in results)
+
+
+def _check_concurrently(
+    backend_adapter: BackendAdapter,
+    checks: Sequence[MeritComplianceCheck],
+    indices: list[int],
+    check_results: dict[int, dict],
+    early_exit: bool,
+    **kwargs: Any,
+) -> None:
+    """Run the given checks in a thread pool, storing their results in check_results."""
+    executor = ThreadPoolExecutor(max_workers=len(indices))
+    try:
+        futures = {
+            executor.submit(checks[index].check, backend_adapter, **kwargs): index
+            for index in indices
+        }
+        not_done = set(futures)
+        while not_done:
+            done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+            for future in done:
+                check_results[futures[future]] = future.result()
+            if early_exit and not _all_passed(check_results[futures[f]] for f in done):
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _is_batchable(check: MeritComplianceCheck) -> bool:
+    """A check can join a batch if it is a plain MeritComplianceCheck on a CircuitFigureOfMerit."""
+    return type(check).check is MeritComplianceCheck.check and isinstance(
+        getattr(check, "figure_of_merit", None), CircuitFigureOfMerit
+    )
+
+
+def _check_in_batch(
+    backend_adapter: BackendAdapter, checks: Sequence[MeritComplianceCheck], **kwargs: Any
+) -> list[dict]:
+    """Run the experiments of all checks with one run_batch() call per distinct number of shots."""
+    foms: list[CircuitFigureOfMerit] = [check.figure_of_merit for check in checks]  # type: ignore[misc]
+    experiments = [fom.experiment(**kwargs) for fom in foms]
+
+    by_shots: dict[int, list[int]] = defaultdict(list)
+    for index, (_, shots) in enumerate(experiments):
+        by_shots[shots].append(index)
+
+    run_results: dict[int, ExperimentResult] = {}
+    for shots, indices in by_shots.items():
+        circuits: list[QuantumCircuit] = [experiments[index][0] for index in indices]
+        run_results.update(zip(indices, backend_adapter.run_batch(circuits, shots=shots)))
+
+    return [
+        check.check_result(fom.evaluate_result(run_results[index], **kwargs))
+        for index, (check, fom) in enumerate(zip(checks, foms))
+    ]
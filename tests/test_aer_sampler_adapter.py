@@ -51,3 +51,21 @@ def test_t1s():
     t1s = adapter.t1s
     assert all(k in t1s for k in range(1, adapter.n_qubits))
     assert all(t1s[k] == float("inf") for k in range(1, adapter.n_qubits))
+
+
+def test_aer_sampler_run_batch():
+    bell = QuantumCircuit(2)
+    bell.h(0)
+    bell.cx(0, 1)
+    bell.measure_all()
+
+    zeros = QuantumCircuit(3)
+    zeros.measure_all()
+
+    adapter = AerSamplerAdapter()
+    results = adapter.run_batch([bell, zeros], shots=256)
+
+    assert len(results) == 2
+    assert set(results[0]["counts"]) <= {"00", "11"}
+    assert results[1]["counts"] == {"000": 256}
+    assert all(result["shots"] == 256 for result in results)
@@ -7,6 +7,9 @@ from typing import TYPE_CHECKING
 import pytest
 from pytest import approx
 from qiskit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction
+from qiskit.circuit.library import XGate
+from qiskit_aer import AerSimulator
 from qiskit_ibm_runtime import QiskitRuntimeService
 
 from qonscious.adapters.aer_simulator_adapter import AerSimulatorAdapter
@@ -78,3 +81,27 @@ def test_props():
     )
     assert t1s_avg == approx(real_t1_avg, rel=1e-9, abs=1e-12)
     assert t2s_avg == approx(real_t2_avg, rel=1e-9, abs=1e-12)
+
+
+def test_aer_simulator_adapter_reuses_transpiled_circuit():
+    adapter = AerSimulatorAdapter(AerSimulator(), [], "aer_simulator")
+
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure_all()
+
+    first = adapter.run(qc, shots=128)
+    second = adapter.run(qc, shots=128)
+
+    assert sum(first["counts"].values()) == 128
+    assert sum(second["counts"].values()) == 128
+    assert len(adapter._transpile_cache) == 1
+    assert adapter.transpile(qc) is adapter.transpile(qc)
+
+    # Modifying the circuit in place must not reuse the earlier transpilation
+    qc.data.insert(0, CircuitInstruction(XGate(), (qc.qubits[1],)))
+    third = adapter.run(qc, shots=128)
+
+    assert len(adapter._transpile_cache) == 2
+    assert set(third["counts"]) == {"01", "10"}
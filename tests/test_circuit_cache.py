@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import UnitaryGate
+
+from qonscious.adapters.circuit_cache import CircuitCache, circuit_key
+
+
+def unitary_circuit(matrix) -> QuantumCircuit:
+    qc = QuantumCircuit(1)
+    qc.append(UnitaryGate(matrix), [0])
+    qc.measure_all()
+    return qc
+
+
+def test_circuit_key_handles_array_parameters():
+    identity = unitary_circuit(np.eye(2))
+    flip = unitary_circuit(np.array([[0, 1], [1, 0]]))
+
+    assert circuit_key(identity) is not None
+    assert circuit_key(identity) == circuit_key(unitary_circuit(np.eye(2)))
+    assert circuit_key(identity) != circuit_key(flip)
+
+
+def test_circuit_key_tells_custom_gates_apart():
+    def with_custom_gate(target: int) -> QuantumCircuit:
+        inner = QuantumCircuit(2, name="custom")
+        inner.x(target)
+        qc = QuantumCircuit(2)
+        qc.append(inner.to_gate(), [0, 1])
+        return qc
+
+    assert circuit_key(with_custom_gate(0)) != circuit_key(with_custom_gate(1))
+
+
+def test_circuit_cache_recomputes_modified_circuits():
+    cache: CircuitCache[int] = CircuitCache(maxsize=2)
+    calls = []
+
+    def create(circuit: QuantumCircuit) -> int:
+        calls.append(circuit)
+        return len(calls)
+
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    assert cache.get_or_create(qc, create) == 1
+    assert cache.get_or_create(qc, create) == 1
+    qc.x(0)
+    assert cache.get_or_create(qc, create) == 2
+    assert len(cache) == 2
+
+
+def test_circuit_cache_evicts_least_recently_used():
+    cache: CircuitCache[int] = CircuitCache(maxsize=1)
+    first, second = QuantumCircuit(1), QuantumCircuit(2)
+
+    cache.get_or_create(first, lambda c: 1)
+    cache.get_or_create(second, lambda c: 2)
+
+    assert len(cache) == 1
+    assert cache.get_or_create(first, lambda c: 3) == 3
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qonscious.adapters.aer_sampler_adapter import AerSamplerAdapter
+from qonscious.adapters.circuit_cache import circuit_key
+from qonscious.foms.grover_fom import GroverFigureOfMerit
+
+if TYPE_CHECKING:
+    from qonscious.results.result_types import FigureOfMeritResult
+
+
+def test_grover_fom_finds_targets_on_aer():
+    backend = AerSamplerAdapter()
+    fom = GroverFigureOfMerit(
+        num_targets=2, lambda_factor=1, mu_factor=1, num_qubits=3, targets_int=[1, 6]
+    )
+
+    result: FigureOfMeritResult = fom.evaluate(backend)
+
+    assert result["figure_of_merit"] == fom.__class__.__name__
+    props = result["properties"]
+    assert all(k in props for k in ("score", "P_T", "sigma_T", "P_N"))
+    # An ideal simulator puts (almost) all the probability on the two targets.
+    assert props["P_T"] > 0.9
+    assert props["score"] > 0
+
+
+def test_grover_fom_finds_targets_with_mcx_oracle():
+    # Above 6 qubits the oracle flips each target with a multi-controlled X
+    backend = AerSamplerAdapter()
+    fom = GroverFigureOfMerit(
+        num_targets=2, lambda_factor=1, mu_factor=1, num_qubits=7, targets_int=[3, 100]
+    )
+
+    result: FigureOfMeritResult = fom.evaluate(backend)
+
+    assert result["properties"]["P_T"] > 0.9
+
+
+def test_grover_fom_reuses_circuits():
+    backend = AerSamplerAdapter()
+    fom = GroverFigureOfMerit(
+        num_targets=1, lambda_factor=1, mu_factor=1, num_qubits=3, targets_int=[5]
+    )
+
+    first = fom.evaluate(backend)
+    step = fom._grover_step(3, [5])
+    second = fom.evaluate(backend)
+
+    assert fom._grover_step(3, [5]) is step
+    # Instances with the same configuration build the same circuit, but each gets its own copy
+    same = GroverFigureOfMerit(
+        num_targets=1, lambda_factor=1, mu_factor=1, num_qubits=3, targets_int=[5]
+    )
+    circuit = same.experiment()[0]
+    assert circuit is not fom.experiment()[0]
+    assert circuit_key(circuit) == circuit_key(fom.experiment()[0])
+    circuit.x(0)
+    assert circuit_key(circuit) != circuit_key(fom.experiment()[0])
+    assert first["properties"]["P_T"] > 0.9 and second["properties"]["P_T"] > 0.9
+
+
+def test_compute_score_from_counts():
+    fom = GroverFigureOfMerit(num_targets=2, lambda_factor=1, mu_factor=0.5, num_qubits=3)
+    counts = {"001": 600, "110": 200, "111": 200}
+
+    props = fom._compute_score(counts, ["001", "110"], 1000)
+
+    assert props["P_T"] == 0.8
+    assert math.isclose(props["P_N"], 0.2)
+    # Population std of the target probabilities (0.6, 0.2)
+    assert math.isclose(props["sigma_T"], 0.2)
+    assert math.isclose(props["score"], 0.8 - 0.2 - 0.5 * 0.2)
+
+
+def test_optimal_rounds_uses_exact_angle():
+    fom = GroverFigureOfMerit(num_targets=1, lambda_factor=1, mu_factor=1)
+
+    assert fom._optimal_rounds(8, 2) == 1
+    assert fom._optimal_rounds(1024, 1) == 25
+    # ⌊π/4·√(N/M)⌋ would give 2 here, overshooting the maximum success probability.
+    assert fom._optimal_rounds(128, 19) == 1
+    assert fom._optimal_rounds(16, 0) == 0
+
+
+def test_grover_fom_validates_num_qubits_and_shots():
+    with pytest.raises(ValueError):
+        GroverFigureOfMerit(num_targets=1, lambda_factor=1, mu_factor=1, num_qubits=1)
+
+    assert GroverFigureOfMerit(1, 1, 1).compute_required_shots() == 2000
+    assert GroverFigureOfMerit(1, 1, 1, shots=500).compute_required_shots() == 500
+    for shots in (0, -10):
+        with pytest.raises(ValueError):
+            GroverFigureOfMerit(1, 1, 1, shots=shots)
+
+
+def test_random_targets_are_drawn_once_and_seedable():
+    fom = GroverFigureOfMerit(
+        num_targets=2, lambda_factor=1, mu_factor=1, num_qubits=4, rng=random.Random(7)
+    )
+    same_seed = GroverFigureOfMerit(
+        num_targets=2, lambda_factor=1, mu_factor=1, num_qubits=4, rng=random.Random(7)
+    )
+
+    assert fom.targets_int == same_seed.targets_int
+    assert len(set(fom.targets_int)) == 2
+    assert all(0 <= t < 16 for t in fom.targets_int)
+
+
+def test_compute_score_without_counts():
+    fom = GroverFigureOfMerit(num_targets=1, lambda_factor=1, mu_factor=1, num_qubits=2)
+    empty = {"score": 0.0, "P_T": 0.0, "sigma_T": 0.0, "P_N": 1.0}
+
+    assert fom._compute_score({}, ["01"], 1000) == empty
+    assert fom._compute_score({"01": 5}, ["01"], 0) == empty
+
+
+def test_num_qubits_is_inferred_from_targets():
+    def inferred(**kwargs) -> int:
+        fom = GroverFigureOfMerit(lambda_factor=1, mu_factor=1, **kwargs)
+        return len(fom._search_space).bit_length() - 1
+
+    assert inferred(num_targets=1, targets_int=[7]) == 3
+    assert inferred(num_targets=1, targets_int=[8]) == 4
+    assert inferred(num_targets=1, targets_int=[0]) == 2
+    assert inferred(num_targets=8) == 3
+    assert inferred(num_targets=9) == 4
+
+
+def test_targets_bin_are_padded_to_the_search_space():
+    fom = GroverFigureOfMerit(
+        num_targets=2, lambda_factor=1, mu_factor=1, num_qubits=4, targets_int=[1, 6]
+    )
+    assert fom.targets_bin == ["0001", "0110"]
+    # Inferred from the largest target, with at least MIN_QUBITS bits
+    inferred = GroverFigureOfMerit(num_targets=1, lambda_factor=1, mu_factor=1, targets_int=[1])
+    assert inferred.targets_bin == ["01"]
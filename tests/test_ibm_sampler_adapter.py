@@ -6,6 +6,9 @@ from typing import TYPE_CHECKING
 import pytest
 from dotenv import load_dotenv
 from qiskit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction
+from qiskit.circuit.library import XGate
+from qiskit_ibm_runtime.fake_provider import FakeManilaV2
 
 from qonscious.adapters.ibm_sampler_adapter import IBMSamplerAdapter
 
@@ -53,3 +56,35 @@ def test_ibm_sampler_adapter_basic_run():
     assert isinstance(timestamps, dict)
     assert all(k in timestamps for k in ("created", "running", "finished"))
     assert all(isinstance(timestamps[k], str) for k in timestamps)
+
+
+def test_ibm_sampler_adapter_reuses_transpiled_circuit():
+    adapter = IBMSamplerAdapter(FakeManilaV2())
+
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure_all()
+
+    first = adapter.run(qc, shots=128)
+    second = adapter.run(qc, shots=128)
+
+    assert sum(first["counts"].values()) == 128
+    assert sum(second["counts"].values()) == 128
+    assert len(adapter._transpile_cache) == 1
+
+
+def test_ibm_sampler_adapter_transpiles_modified_circuit_again():
+    adapter = IBMSamplerAdapter(FakeManilaV2())
+
+    qc = QuantumCircuit(1)
+    qc.measure_all()
+    before = adapter.run(qc, shots=64)
+
+    # The same object, modified in place, must not reuse the earlier transpilation
+    qc.data.insert(0, CircuitInstruction(XGate(), (qc.qubits[0],)))
+    after = adapter.run(qc, shots=64)
+
+    assert before["counts"].get("0", 0) > 48
+    assert after["counts"].get("1", 0) > 48
+    assert len(adapter._transpile_cache) == 2
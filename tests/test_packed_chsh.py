@@ -3,7 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from qonscious.adapters.aer_sampler_adapter import AerSamplerAdapter
-from qonscious.foms.packed_chsh import PackedCHSHTest
+from qonscious.adapters.circuit_cache import circuit_key
+from qonscious.foms.packed_chsh import PackedCHSHTest, compute_parallel_CHSH_scores
 
 if TYPE_CHECKING:
     from qonscious.results.result_types import FigureOfMeritResult
@@ -27,3 +28,40 @@ def test_packed_chsh_constraint_passes():
 
     # Evaluate the result
     assert result["properties"]["score"] > 2
+
+
+def test_packed_chsh_experiment_returns_a_copy():
+    circuit, _ = PackedCHSHTest().experiment()
+    circuit.x(0)
+
+    assert circuit_key(PackedCHSHTest().experiment()[0]) != circuit_key(circuit)
+    assert PackedCHSHTest().evaluate(AerSamplerAdapter())["properties"]["score"] > 2
+
+
+def test_compute_parallel_CHSH_scores_from_counts():
+    # Pairs are read from the right: qubits (0, 1) form the first pair.
+    # Pair 0 always agrees, pair 1 always disagrees, pairs 2 and 3 are balanced.
+    counts = {"00000001": 0, "00000100": 10, "00010100": 10}
+    scores = compute_parallel_CHSH_scores(counts)
+    assert scores["E00"] == 1.0
+    assert scores["E01"] == -1.0
+    assert scores["E10"] == 0.0
+    assert scores["E11"] == 1.0
+    assert scores["score"] == -1.0
+
+
+def test_compute_parallel_CHSH_scores_empty_counts():
+    scores = compute_parallel_CHSH_scores({})
+    assert scores == {"E00": 0.0, "E01": 0.0, "E10": 0.0, "E11": 0.0, "score": 0.0}
+
+
+def test_compute_parallel_CHSH_scores_from_probabilities():
+    counts = {"00000001": 0, "00000100": 10, "00010100": 10}
+    probabilities = {"00000001": 0.0, "00000100": 0.5, "00010100": 0.5}
+    assert compute_parallel_CHSH_scores(probabilities) == compute_parallel_CHSH_scores(counts)
+
+
+def test_compute_parallel_CHSH_scores_accepts_integer_outcomes():
+    counts = {"00000001": 3, "00000100": 10, "00010100": 7}
+    int_counts = {int(k, 2): v for k, v in counts.items()}
+    assert compute_parallel_CHSH_scores(int_counts) == compute_parallel_CHSH_scores(counts)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 
 from qonscious.actions.qonscious_callable import QonsciousCallable
 from qonscious.adapters.aer_sampler_adapter import AerSamplerAdapter
 from qonscious.checks.merit_compliance_check import MeritComplianceCheck
+from qonscious.foms.grover_fom import GroverFigureOfMerit
+from qonscious.foms.packed_chsh import PackedCHSHTest
 from qonscious.run_conditionally import run_conditionally
 
 if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
     from qonscious.adapters.backend_adapter import BackendAdapter
     from qonscious.results.result_types import (
         ExperimentResult,
@@ -62,3 +67,174 @@ def test_run_conditionally():
     )
     assert result["condition"] == "fail"
     assert result["experiment_result"] is not None and result["experiment_result"]["shots"] == 0
+
+
+class CountingAerSamplerAdapter(AerSamplerAdapter):
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes: list[int] = []
+
+    def run_batch(self, circuits: list[QuantumCircuit], **kwargs) -> list[ExperimentResult]:
+        self.batch_sizes.append(len(circuits))
+        return super().run_batch(circuits, **kwargs)
+
+
+def test_run_conditionally_batches_circuit_checks():
+    backend = CountingAerSamplerAdapter()
+    checks = [
+        MeritComplianceCheck(PackedCHSHTest(), lambda r: r["properties"]["score"] > 2),
+        DummyComplianceCheck(True),
+        MeritComplianceCheck(PackedCHSHTest(), lambda r: r["properties"]["score"] > 2),
+    ]
+
+    def on_pass(
+        adapter: BackendAdapter, figures_of_merit_results: list[FigureOfMeritResult], **kwargs
+    ) -> ExperimentResult | None:
+        return figures_of_merit_results[0]["experiment_result"]
+
+    result: QonsciousResult = run_conditionally(
+        backend, checks, QonsciousCallable(on_pass), QonsciousCallable(on_pass), shots=512
+    )
+
+    assert backend.batch_sizes == [2]
+    assert result["condition"] == "pass"
+    assert len(result["figures_of_merit_results"]) == 3
+    assert result["figures_of_merit_results"][1] == {}
+    experiment_result = result["figures_of_merit_results"][2]["experiment_result"]
+    assert experiment_result is not None and experiment_result["shots"] == 512
+
+
+def test_run_conditionally_batches_grover_with_chsh():
+    backend = CountingAerSamplerAdapter()
+    grover = GroverFigureOfMerit(
+        num_targets=1, lambda_factor=1, mu_factor=1, num_qubits=3, targets_int=[5], shots=512
+    )
+    checks = [
+        MeritComplianceCheck(grover, lambda r: r["properties"]["P_T"] > 0.9),
+        MeritComplianceCheck(PackedCHSHTest(), lambda r: r["properties"]["score"] > 2),
+    ]
+
+    def on_pass(
+        adapter: BackendAdapter, figures_of_merit_results: list[FigureOfMeritResult], **kwargs
+    ) -> ExperimentResult | None:
+        return None
+
+    result: QonsciousResult = run_conditionally(
+        backend, checks, QonsciousCallable(on_pass), QonsciousCallable(on_pass), shots=512
+    )
+
+    assert backend.batch_sizes == [2]
+    assert result["condition"] == "pass"
+    assert result["figures_of_merit_results"][0]["figure_of_merit"] == "GroverFigureOfMerit"
+
+
+class SlowComplianceCheck(MeritComplianceCheck):
+    def __init__(self, delay: float, label: str, passed: bool = True):
+        self.delay = delay
+        self.label = label
+        self.passed = passed
+        self.calls = 0
+
+    def check(self, backend_adapter: BackendAdapter, **kwargs) -> dict:
+        self.calls += 1
+        time.sleep(self.delay)
+        fom_result: FigureOfMeritResult = {
+            "timestamp": "",
+            "figure_of_merit": self.label,
+            "properties": {},
+            "experiment_result": None,
+        }
+        return {"passed": self.passed, "fom_result": fom_result}
+
+
+def test_run_conditionally_parallel_checks_keep_order():
+    backend = AerSamplerAdapter()
+    checks = [SlowComplianceCheck(0.2, "slow"), SlowComplianceCheck(0.0, "fast")]
+
+    def on_pass(
+        adapter: BackendAdapter, figures_of_merit_results: list[FigureOfMeritResult]
+    ) -> ExperimentResult | None:
+        return None
+
+    for parallel in (True, False):
+        result: QonsciousResult = run_conditionally(
+            backend,
+            checks,
+            QonsciousCallable(on_pass),
+            QonsciousCallable(on_pass),
+            parallel=parallel,
+        )
+        labels = [r["figure_of_merit"] for r in result["figures_of_merit_results"]]
+        assert labels == ["slow", "fast"]
+
+
+def test_run_conditionally_stops_at_first_failing_check():
+    backend = AerSamplerAdapter()
+    checks = [DummyComplianceCheck(True), DummyComplianceCheck(False), DummyComplianceCheck(True)]
+
+    def on_any(
+        adapter: BackendAdapter, figures_of_merit_results: list[FigureOfMeritResult]
+    ) -> ExperimentResult | None:
+        return None
+
+    result: QonsciousResult = run_conditionally(
+        backend, checks, QonsciousCallable(on_any), QonsciousCallable(on_any), parallel=False
+    )
+    assert result["condition"] == "fail"
+    assert len(result["figures_of_merit_results"]) == 2
+
+    result = run_conditionally(
+        backend,
+        checks,
+        QonsciousCallable(on_any),
+        QonsciousCallable(on_any),
+        parallel=False,
+        early_exit=False,
+    )
+    assert result["condition"] == "fail"
+    assert len(result["figures_of_merit_results"]) == 3
+
+
+def test_run_conditionally_parallel_stops_at_first_failing_check():
+    backend = AerSamplerAdapter()
+    checks = [SlowComplianceCheck(2.0, "slow"), SlowComplianceCheck(0.0, "fast", passed=False)]
+
+    def on_any(
+        adapter: BackendAdapter, figures_of_merit_results: list[FigureOfMeritResult]
+    ) -> ExperimentResult | None:
+        return None
+
+    start = time.perf_counter()
+    result: QonsciousResult = run_conditionally(
+        backend, checks, QonsciousCallable(on_any), QonsciousCallable(on_any), parallel=True
+    )
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    assert result["condition"] == "fail"
+    labels = [r["figure_of_merit"] for r in result["figures_of_merit_results"]]
+    assert labels == ["fast"]
+
+
+def test_run_conditionally_skips_checks_after_failing_batch():
+    backend = CountingAerSamplerAdapter()
+    remaining = SlowComplianceCheck(0.0, "remaining")
+    checks = [
+        MeritComplianceCheck(PackedCHSHTest(), lambda r: r["properties"]["score"] > 3),
+        MeritComplianceCheck(PackedCHSHTest(), lambda r: r["properties"]["score"] > 3),
+        remaining,
+    ]
+
+    def on_any(
+        adapter: BackendAdapter, figures_of_merit_results: list[FigureOfMeritResult]
+    ) -> ExperimentResult | None:
+        return None
+
+    result: QonsciousResult = run_conditionally(
+        backend, checks, QonsciousCallable(on_any), QonsciousCallable(on_any)
+    )
+
+    assert backend.batch_sizes == [2]
+    assert result["condition"] == "fail"
+    assert len(result["figures_of_merit_results"]) == 2
+    assert remaining.calls == 0
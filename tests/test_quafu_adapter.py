@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import os
 
 import pytest
 from dotenv import load_dotenv
 from qiskit import QuantumCircuit
+from quafu import QuantumCircuit as QuafuQuantumCircuit
 
 from qonscious.adapters.quafu_backend_adapter import QuafuBackendAdapter
 
@@ -34,6 +36,17 @@ def circuits_fixture():
     }
 
 
+def test_run_batch_inside_running_event_loop():
+    # No account is needed: an empty batch submits nothing to Quafu
+    adapter = QuafuBackendAdapter.__new__(QuafuBackendAdapter)
+
+    async def from_async_code():
+        return adapter.run_batch([], shots=16)
+
+    assert adapter.run_batch([], shots=16) == []
+    assert asyncio.run(from_async_code()) == []
+
+
 @pytest.mark.quafu_apikey_required
 def test_service_availability(token_based_fixture):
     assert token_based_fixture["adapter"] is not None
@@ -50,3 +63,60 @@ def test_run_simulated(token_based_fixture, circuits_fixture):
     assert result["counts"] is not None
     assert sum(result["counts"].values()) == 1024
     assert "00" in result["counts"] and "11" in result["counts"]
+
+
+@pytest.mark.quafu_apikey_required
+def test_run_batch_simulated(token_based_fixture, circuits_fixture):
+    circuits = [circuits_fixture["phi_plus"]] * 2
+    results = token_based_fixture["adapter"].run_batch(circuits, shots=512)
+    assert len(results) == 2
+    for result in results:
+        assert sum(result["counts"].values()) == 512
+
+
+def test_ccx_is_translated_as_with_add_ins():
+    qc = QuantumCircuit(3, 3)
+    qc.ccx(0, 1, 2)
+    translated = QuafuBackendAdapter._convert_circuit(qc)
+
+    # The same decomposition, built with Quafu's own methods (which go through add_ins)
+    expected = QuafuQuantumCircuit(3)
+    expected.h(2).cnot(1, 2).tdg(2).cnot(0, 2).t(2).cnot(1, 2).tdg(2).cnot(0, 2)
+    expected.t(1).t(2).h(2).cnot(0, 1).t(0).tdg(1).cnot(0, 1)
+    expected.measure()
+
+    def layout(circuit):
+        return [(gate.name, list(gate.pos)) for gate in circuit.gates]
+
+    assert layout(translated) == layout(expected)
+    assert len(translated.instructions) == len(expected.instructions)
+    assert translated.measures == expected.measures
+
+
+def test_convert_batch_matches_single_conversions():
+    bell = QuantumCircuit(2, 2)
+    bell.h(0)
+    bell.cx(0, 1)
+    bell.measure([0, 1], [0, 1])
+    rotations = QuantumCircuit(3, 3)
+    rotations.rx(0.25, 0)
+    rotations.ry(1.5, 1)
+    rotations.rz(3.14159, 2)
+    rotations.ccx(0, 1, 2)
+    rotations.measure([0, 1, 2], [0, 1, 2])
+    # An sx gate has no manual conversion, so this circuit goes through OpenQASM
+    openqasm = QuantumCircuit(2, 2)
+    openqasm.sx(0)
+    openqasm.cz(0, 1)
+    openqasm.measure([0, 1], [0, 1])
+    circuits = [bell, rotations, openqasm, bell]
+
+    def layout(circuit):
+        gates = [(gate.name, list(gate.pos), list(gate.paras)) for gate in circuit.gates]
+        return gates, circuit.measures
+
+    converted = QuafuBackendAdapter.convert_batch(circuits, workers=2)
+
+    assert [layout(circuit) for circuit in converted] == [
+        layout(QuafuBackendAdapter._convert_circuit(circuit)) for circuit in circuits
+    ]
@@ -1,9 +1,3 @@
-import os
-import sys
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
-
-# Ahora puedes importar qonscious
 from qonscious import run_conditionally
 from qonscious.actions import QonsciousCallable
 from qonscious.adapters import QuafuBackendAdapter
@@ -1,200 +1,149 @@
-import os
+import logging
 import sys
+from collections import Counter
 
-# Agregar el directorio src al path de Python
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+import pytest
 
 from qonscious import run_conditionally
 from qonscious.actions import QonsciousCallable
-from qonscious.adapters import QuafuBackendAdapter
 from qonscious.checks import MeritComplianceCheck
 from qonscious.foms import GroverFigureOfMerit
 
+# QuafuBackendAdapter (que carga pyquafu) se importa en el fixture quafu_adapter, para no
+# cargarlo al recolectar tests que no se ejecutan.
+logger = logging.getLogger(__name__)
+
+# Todas las configuraciones se envían en un mismo run_batch, con la misma cantidad de shots
+GROVER_SHOTS = 1000
+
+MAIN_CFG = {
+    "name": "Grover 3 qubits - targets |010⟩ y |101⟩",
+    "num_qubits": 3,            # 3 qubits (espacio de búsqueda de 8 estados)
+    "num_targets": 2,           # 2 estados target
+    "targets_int": [2, 5],      # estados target específicos: |010⟩ y |101⟩
+}
+
+VARIATIONS = [
+    {
+        "name": "Grover 2 qubits - 1 target",
+        "num_qubits": 2,
+        "num_targets": 1,
+        "targets_int": [2],  # |10⟩
+    },
+    {
+        "name": "Grover 3 qubits - 2 targets",
+        "num_qubits": 3,
+        "num_targets": 2,
+        "targets_int": [3, 6],  # |011⟩, |110⟩
+    },
+    {
+        "name": "Grover 3 qubits - 1 target",
+        "num_qubits": 3,
+        "num_targets": 1,
+        "targets_int": [5],  # |101⟩
+    },
+]
+
+GROVER_CONFIGS = [MAIN_CFG, *VARIATIONS]
+
+
+@pytest.fixture(scope="module")
+def quafu_adapter():
+    """Un único adapter Quafu (y su conexión) compartido por todos los tests del módulo"""
+    from qonscious.adapters import QuafuBackendAdapter
+
+    print("🔄 Creando adapter Quafu...")
+    return QuafuBackendAdapter()
+
+
+@pytest.fixture(scope="module")
+def grover_runs(quafu_adapter):
+    """Construye los circuitos de todas las configuraciones y los envía juntos con run_batch,
+    así Quafu recibe todas las tareas antes de esperar la primera. Devuelve, por nombre de
+    configuración, su FoM y su resultado."""
+    foms = [_grover_fom(config) for config in GROVER_CONFIGS]
+    experiments = [grover_fom.experiment() for grover_fom in foms]
+    # run_batch takes one number of shots; every FoM is built with GROVER_SHOTS
+    assert all(shots == GROVER_SHOTS for _, shots in experiments)
+    run_results = quafu_adapter.run_batch([qc for qc, _ in experiments], shots=GROVER_SHOTS)
+    return {
+        config["name"]: (grover_fom, run_result)
+        for config, grover_fom, run_result in zip(GROVER_CONFIGS, foms, run_results)
+    }
+
+
+def _grover_fom(config):
+    """Crea el FoM de una configuración; las configuraciones repetidas reusan el circuito"""
+    return GroverFigureOfMerit(
+        num_targets=config["num_targets"],
+        lambda_factor=0.1,       # factor lambda para desviación estándar
+        mu_factor=0.5,           # factor mu para no-targets
+        num_qubits=config["num_qubits"],
+        targets_int=config["targets_int"],
+        shots=GROVER_SHOTS,
+    )
+
+
+def _report(config, grover_fom, metrics, counts, passed):
+    """Arma el bloque de resultados de una configuración, para imprimirlo de una sola vez"""
+    n = grover_fom.num_qubits
+    rounds = grover_fom._optimal_rounds(1 << n, config["num_targets"])
+    best = Counter(counts).most_common(1)[0][0] if counts else "N/A"
+    status = "✅ GROVER EXITOSO" if passed else "❌ GROVER FALLÓ"
+    return (
+        f"\n🔧 Probando: {config['name']}\n"
+        + "-" * 40 + "\n"
+        f"   - Qubits: {n}\n"
+        f"   - Targets: {grover_fom.targets_int} → {grover_fom.targets_bin}\n"
+        f"   - Espacio búsqueda: 2^{n} = {2**n} estados\n"
+        f"   - Iteraciones Grover: {rounds}\n"
+        f"{status} - Score: {metrics['score']:.3f}\n"
+        f"   Probabilidad targets (P_T): {metrics['P_T']:.3f}\n"
+        f"   Probabilidad no-targets (P_N): {metrics['P_N']:.3f}\n"
+        f"   Desviación estándar targets (σ_T): {metrics['sigma_T']:.3f}\n"
+        f"   Mejor resultado: {best}"
+    )
+
+
+@pytest.mark.quafu_apikey_required
+@pytest.mark.parametrize("config", GROVER_CONFIGS, ids=lambda config: config["name"])
+def test_grover(config, grover_runs):
+    """Prueba el test GRADE Grover con Quafu para cada configuración"""
+    grover_fom, run_result = grover_runs[config["name"]]
+
+    error = run_result["backend_properties"].get("error")
+    if error:
+        logger.error("Configuración %s falló: %s", config["name"], error)
+    assert not error
+
+    # Calcular métricas con el FoM (lambda, mu y shots los toma de grover_fom);
+    # considerar éxito si score > 0.1
+    counts = run_result["counts"]
+    metrics = grover_fom.evaluate_result(run_result)["properties"]
+    passed = metrics["score"] > 0.1
+    print(_report(config, grover_fom, metrics, counts, passed))
+
+    assert 0.0 <= metrics["score"] <= 1.0
+    assert metrics["P_T"] + metrics["P_N"] == pytest.approx(1.0)
+
+
+@pytest.mark.quafu_apikey_required
+def test_grover_quafu_run_conditionally(quafu_adapter):
+    """El test Grover principal, a través de run_conditionally y MeritComplianceCheck"""
+    grover_check = MeritComplianceCheck(
+        figure_of_merit=_grover_fom(MAIN_CFG),
+        decision_function=lambda result: result["properties"]["score"] > 0.1,
+    )
+
+    result = run_conditionally(
+        backend_adapter=quafu_adapter,
+        checks=[grover_check],
+        on_pass=QonsciousCallable(lambda backend, fom_results, **kwargs: None),
+        on_fail=QonsciousCallable(lambda backend, fom_results, **kwargs: None),
+    )
+
+    assert result["condition"] in ("pass", "fail")
 
-def test_grover_quafu():
-    """Prueba el test GRADE Grover con Quafu"""
-
-    print("🧪 TEST GROVER GRADE CON QUAFU")
-    print("=" * 50)
-
-    try:
-        # Crear adapter Quafu
-        print("🔄 Creando adapter Quafu...")
-        adapter = QuafuBackendAdapter()
-
-        # Configurar test Grover
-        grover_fom = GroverFigureOfMerit(
-            num_targets=2,           # 2 estados target
-            lambda_factor=0.1,       # factor lambda para desviación estándar
-            mu_factor=0.5,           # factor mu para no-targets
-            num_qubits=3,            # 3 qubits (espacio de búsqueda de 8 estados)
-            targets_int=[2, 5]       # estados target específicos: |010⟩ y |101⟩
-        )
-
-        # Configurar check - considerar éxito si score > 0.1
-        grover_check = MeritComplianceCheck(
-            figure_of_merit=grover_fom,
-            decision_function=lambda result: (
-                result is not None and
-                result["properties"]["score"] > 0.1
-            )
-        )
-
-        # Acciones
-        def grover_success(backend, fom_results, **kwargs):
-            result = fom_results[0]["properties"]
-            score = result["score"]
-            P_T = result["P_T"]
-            P_N = result["P_N"]
-            sigma_T = result["sigma_T"]
-
-            print(f"✅ GROVER EXITOSO - Score: {score:.3f}")
-            print(f"   Probabilidad targets (P_T): {P_T:.3f}")
-            print(f"   Probabilidad no-targets (P_N): {P_N:.3f}")
-            print(f"   Desviación estándar targets (σ_T): {sigma_T:.3f}")
-            print(f"   Iteraciones Grover: {result['grover_iterations']}")
-            print(f"   Targets: {result['target_states']}")
-
-            return {
-                "resultado": "grover_exitoso",
-                "score": score,
-                "P_T": P_T,
-                "P_N": P_N,
-                "sigma_T": sigma_T
-            }
-
-        def grover_fail(backend, fom_results, **kwargs):
-            result = fom_results[0]["properties"]
-            score = result["score"]
-            P_T = result["P_T"]
-
-            print(f"❌ GROVER FALLÓ - Score: {score:.3f}")
-            print(f"   Probabilidad targets: {P_T:.3f}")
-            print(f"   Iteraciones Grover: {result['grover_iterations']}")
-
-            return {
-                "resultado": "grover_fallido",
-                "score": score,
-                "P_T": P_T
-            }
-
-        print("\n🎯 EJECUTANDO TEST GROVER...")
-        print("   Configuración:")
-        print(f"   - Qubits: {grover_fom.num_qubits}")
-        print(f"   - Targets: {[2, 5]} → {['010', '101']}")
-        print(f"   - Espacio búsqueda: 2^{grover_fom.num_qubits} = {2**grover_fom.num_qubits} estados")
-        print(f"   - Iteraciones Grover: {grover_fom._optimal_rounds(8, 2)}")
-
-        # Ejecutar test
-        result = run_conditionally(
-            backend_adapter=adapter,
-            checks=[grover_check],
-            on_pass=QonsciousCallable(grover_success),
-            on_fail=QonsciousCallable(grover_fail),
-        )
-
-        # Mostrar resultados detallados
-        print("\n" + "=" * 50)
-        print("📊 RESULTADOS GROVER FINALES:")
-        print(f"   Backend usado: {adapter.name}")
-        print(f"   Condición: {result['condition']}")
-
-        if result['figures_of_merit_results']:
-            grover_result = result['figures_of_merit_results'][0]["properties"]
-            print(f"   Score Grover: {grover_result['score']:.3f}")
-            print(f"   P_T: {grover_result['P_T']:.3f}")
-            print(f"   P_N: {grover_result['P_N']:.3f}")
-            print(f"   σ_T: {grover_result['sigma_T']:.3f}")
-            print(f"   Iteraciones: {grover_result['grover_iterations']}")
-            print(f"   Targets: {grover_result['target_states']}")
-
-        if result['experiment_result']:
-            print(f"   Acción ejecutada: {result['experiment_result']}")
-
-        return result
-
-    except Exception as e:
-        print(f"❌ Error en test Grover: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
-
-def test_grover_variations():
-    """Prueba diferentes configuraciones de Grover"""
-
-    print("\n🧪 VARIACIONES DE GROVER")
-    print("=" * 50)
-
-    variations = [
-        {
-            "name": "Grover 2 qubits - 1 target",
-            "num_qubits": 2,
-            "num_targets": 1,
-            "targets_int": [2],  # |10⟩
-            "shots": 1000
-        },
-        {
-            "name": "Grover 3 qubits - 2 targets",
-            "num_qubits": 3,
-            "num_targets": 2,
-            "targets_int": [3, 6],  # |011⟩, |110⟩
-            "shots": 1000
-        },
-        {
-            "name": "Grover 3 qubits - 1 target",
-            "num_qubits": 3,
-            "num_targets": 1,
-            "targets_int": [5],  # |101⟩
-            "shots": 1000
-        }
-    ]
-
-    adapter = QuafuBackendAdapter()
-
-    for config in variations:
-        print(f"\n🔧 Probando: {config['name']}")
-        print("-" * 40)
-
-        try:
-            grover_fom = GroverFigureOfMerit(
-                num_targets=config["num_targets"],
-                lambda_factor=0.1,
-                mu_factor=0.5,
-                num_qubits=config["num_qubits"],
-                targets_int=config["targets_int"]
-            )
-
-            # Ejecutar directamente sin check condicional
-            qc = grover_fom._build_grover_circuit(
-                grover_fom.num_qubits,
-                [format(t, f"0{grover_fom.num_qubits}b") for t in config["targets_int"]],
-                grover_fom._optimal_rounds(2**grover_fom.num_qubits, config["num_targets"])
-            )
-
-            run_result = adapter.run(qc, shots=config["shots"])
-            counts = run_result["counts"]
-
-            # Calcular métricas manualmente
-            metrics = grover_fom._compute_score(
-                counts,
-                [format(t, f"0{grover_fom.num_qubits}b") for t in config["targets_int"]],
-                config["shots"],
-                0.1, 0.5
-            )
-
-            print(f"   Score: {metrics['score']:.3f}")
-            print(f"   P_T: {metrics['P_T']:.3f}")
-            print(f"   P_N: {metrics['P_N']:.3f}")
-            print(f"   Mejor resultado: {max(counts, key=counts.get) if counts else 'N/A'}")
-
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
 
 if __name__ == "__main__":
-    # Ejecutar test principal
-    main_result = test_grover_quafu()
-
-    # Ejecutar variaciones (opcional)
-    if main_result and main_result['condition'] == 'pass':
-        print("\n" + "=" * 60)
-        test_grover_variations()
+    sys.exit(pytest.main([__file__, "-s", "-m", "quafu_apikey_required"]))